@@ -1,13 +1,214 @@
 import sys
 import os
 import shutil
+import csv
+import asyncio
 
-from generator import TaskRequirements, TaskGenerator
+from generator import TaskRequirements, TaskGenerator, SchedulabilityExperiment, GenerationService, collect_statistics
+from generator import Requirement, run_pipeline
+from scheduling import analyze_folder, run_regression, PollingServerSearch
+from model import TaskSet
+
+def parse_options(args: list[str]) -> dict:
+    '''
+    Parse "--key value" pairs; a key without a value is treated as a flag set to True.
+    '''
+    options = {}
+    i = 0
+    while i < len(args):
+        if not args[i].startswith("--"):
+            print(f"Unexpected argument: {args[i]}")
+            sys.exit(1)
+        key = args[i][2:]
+        if i + 1 < len(args) and not args[i + 1].startswith("--"):
+            options[key] = args[i + 1]
+            i += 2
+        else:
+            options[key] = True
+            i += 1
+    return options
+
+def parse_range(value: str) -> list[float]:
+    '''
+    Parse either a comma separated list or an inclusive "start:stop:step" range.
+    '''
+    if ":" in value:
+        start, stop, step = (float(v) for v in value.split(":"))
+        count = int(round((stop - start) / step)) + 1
+        return [round(start + k * step, 2) for k in range(count)]
+    return [float(v) for v in value.split(",")]
+
+def run_experiment(args: list[str], output_folder: str) -> None:
+    options = parse_options(args)
+    if "sizes" not in options or "utilizations" not in options:
+        print("Usage: python generator.py experiment --sizes <n1,n2,...> --utilizations <start:stop:step>")
+        print("           [--unique-periods] [--width 0.05] [--confidence 0.95] [--batch-size 50]")
+        print("           [--max-samples 10000] [--workers <n>] [--seed <n>] [--output <path.csv>]")
+        sys.exit(1)
+
+    experiment = SchedulabilityExperiment(
+        sizes=[int(v) for v in options["sizes"].split(",")],
+        utilizations=parse_range(options["utilizations"]),
+        unique_periods=options.get("unique-periods") is True,
+        width=float(options.get("width", 0.05)),
+        confidence=float(options.get("confidence", 0.95)),
+        batch_size=int(options.get("batch-size", 50)),
+        max_samples=int(options.get("max-samples", 10000)),
+        workers=int(options["workers"]) if "workers" in options else None,
+        seed=int(options["seed"]) if "seed" in options else None,
+    )
+    output = options.get("output", os.path.join(output_folder, "experiment.csv"))
+
+    print("Running schedulability experiment...")
+    experiment.run()
+    experiment.to_csv(output)
+    for point in experiment.points:
+        lower, upper = point.confidence_interval(experiment.confidence)
+        status = f"\033[91m{point.error}\033[0m" if point.error else f"[{lower:.3f}, {upper:.3f}]"
+        print(f"Size {point.size:>4}  U={point.utilization:.2f}  samples={point.samples:>6}  ratio={point.ratio:.3f}  {status}")
+    print(f"Results stored in: \033[92m{output}\033[0m")
+
+def run_breakdown(args: list[str]) -> None:
+    if not args or args[0].startswith("--"):
+        print("Usage: python generator.py breakdown <taskset.csv|folder> [--tolerance 1e-4] [--workers <n>] [--output <path.csv>]")
+        sys.exit(1)
+    path = args[0]
+    options = parse_options(args[1:])
+    # Results go outside output_generated so a later scan of the tasksets does not pick them up
+    output = options.get("output", os.path.join("output_analysis", "breakdown.csv"))
+
+    results = analyze_folder(
+        path,
+        tolerance=float(options.get("tolerance", 1e-4)),
+        workers=int(options["workers"]) if "workers" in options else None,
+    )
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=['File', 'Utilization', 'ScalingFactor', 'BreakdownUtilization'])
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result)
+            print(f"{result['File']}: U={result['Utilization']:.4f}  factor={result['ScalingFactor']:.4f}  breakdown={result['BreakdownUtilization']:.4f}")
+    print(f"Results stored in: \033[92m{output}\033[0m")
+
+def run_service(args: list[str]) -> None:
+    options = parse_options(args)
+    if not isinstance(options.get("socket"), str) and not isinstance(options.get("port"), str):
+        print("Usage: python generator.py serve --socket <path> | --port <port> [--host 127.0.0.1] [--workers <n>]")
+        sys.exit(1)
+
+    async def serve():
+        service = GenerationService(int(options["workers"]) if "workers" in options else None)
+        await service.start()
+        try:
+            if isinstance(options.get("socket"), str):
+                server = await service.serve_unix(options["socket"])
+                address = options["socket"]
+            else:
+                host = options.get("host", "127.0.0.1")
+                server = await service.serve_tcp(host, int(options["port"]))
+                address = f"{host}:{options['port']}"
+            print(f"Serving taskset generation on \033[92m{address}\033[0m with {service.workers} workers")
+            async with server:
+                await server.serve_forever()
+        finally:
+            service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+def run_statistics(args: list[str]) -> None:
+    if not args or args[0].startswith("--"):
+        print("Usage: python generator.py stats <folder|taskset.csv|list.txt> [--workers <n>]")
+        sys.exit(1)
+    options = parse_options(args[1:])
+    statistics = collect_statistics(args[0], int(options["workers"]) if "workers" in options else None)
+    print(statistics.report())
+
+def run_regression_suite(args: list[str]) -> None:
+    options = parse_options(args)
+    slow = float(options.get("slow", 1.0))
+    results = run_regression(
+        options.get("solutions", "solution"),
+        options.get("examples", "test_examples"),
+        int(options["workers"]) if "workers" in options else None,
+    )
+
+    failed = 0
+    for result in results:
+        status = "\033[92mPASS\033[0m" if result.passed else "\033[91mFAIL\033[0m"
+        timing = f"{result.elapsed * 1000:8.1f} ms"
+        if result.elapsed > slow:
+            timing = f"\033[93m{timing} (slow)\033[0m"
+        print(f"{status}  {timing}  {result.case.name}")
+        for difference in result.differences:
+            print(f"        {difference}")
+        failed += not result.passed
+    print(f"\n{len(results) - failed}/{len(results)} cases passed")
+    sys.exit(1 if failed else 0)
+
+def run_server_search(args: list[str]) -> None:
+    if not args or args[0].startswith("--"):
+        print("Usage: python generator.py server <taskset.csv> [--periods <start:stop:step|p1,p2,...>]")
+        sys.exit(1)
+    options = parse_options(args[1:])
+    periods = None
+    if isinstance(options.get("periods"), str):
+        periods = [int(p) for p in parse_range(options["periods"])]
+
+    try:
+        design = PollingServerSearch(TaskSet.from_csv(args[0])).search(periods)
+    except ValueError as e:
+        print(f"\033[91mError: {e}\033[0m")
+        sys.exit(1)
+    if design is None:
+        print("\033[91mNo polling server keeps the time-triggered tasks schedulable.\033[0m")
+        sys.exit(1)
+
+    print(f"Polling server: budget={design.budget}  period={design.period}  WCRT={design.server_response_time:g}")
+    for name, response in design.tt_response_times.items():
+        print(f"  TT {name}: WCRT={response:g}")
+    for name, response in design.et_response_times.items():
+        print(f"  ET {name}: WCRT<={response:g}")
+    if design.et_misses:
+        print(f"\033[93mWarning: no polling server meets every ET deadline; this design has the fewest misses ({design.et_misses}).\033[0m")
+
+def run_pipeline_command(args: list[str]) -> None:
+    options = parse_options(args)
+    if not all(isinstance(options.get(key), str) for key in ("size", "utilization", "count")):
+        print("Usage: python generator.py pipeline --size <n> --utilization <u> --count <n> [--unique-periods]")
+        print("           [--producers <n>] [--consumers <n>] [--slots 64] [--seed <n>]")
+        sys.exit(1)
+
+    row = {
+        'Name': 'Pipeline', 'Size': options["size"], 'Utilization': options["utilization"],
+        'UniquePeriods': options.get("unique-periods") is True, 'PriorityAssignment': 'RM',
+    }
+    result = run_pipeline(
+        Requirement.from_row(row),
+        int(options["count"]),
+        producers=int(options["producers"]) if "producers" in options else None,
+        consumers=int(options["consumers"]) if "consumers" in options else None,
+        slots=int(options.get("slots", 64)),
+        seed=int(options["seed"]) if "seed" in options else None,
+    )
+    print(f"Generated and analyzed {result.generated} tasksets in {result.elapsed:.2f} s ({result.throughput:.0f} tasksets/s)")
+    print(f"Schedulable: {result.schedulable}/{result.generated}")
 
 def parse_args():
     if len(sys.argv) < 2:
-        print("Usage: python generator.py run --config <path_to_requirements.csv>")
+        print("Usage: python generator.py run --config <path_to_requirements.csv> [--unique-sets] [--profile [N]]")
         print("       python generator.py clean")
+        print("       python generator.py experiment --sizes <n1,n2,...> --utilizations <start:stop:step>")
+        print("       python generator.py breakdown <taskset.csv|folder>")
+        print("       python generator.py serve --socket <path> | --port <port>")
+        print("       python generator.py stats <folder|taskset.csv|list.txt>")
+        print("       python generator.py regression [--solutions solution] [--examples test_examples]")
+        print("       python generator.py server <taskset.csv> [--periods <start:stop:step>]")
+        print("       python generator.py pipeline --size <n> --utilization <u> --count <n>")
         sys.exit(1)
         
     command = sys.argv[1]
@@ -25,20 +226,46 @@ def parse_args():
         sys.exit(0)
         
     elif command == "run":
-        if len(sys.argv) != 4 or sys.argv[2] != "--config":
-            print("Usage: python taskset_generator.py run --config <path_to_requirements.csv>")
+        options = parse_options(sys.argv[2:])
+        if not isinstance(options.get("config"), str) or set(options) - {"config", "unique-sets", "profile"}:
+            print("Usage: python generator.py run --config <path_to_requirements.csv> [--unique-sets] [--profile [N]]")
             sys.exit(1)
-        csv_path = sys.argv[3]
+        csv_path = options["config"]
+    elif command == "experiment":
+        run_experiment(sys.argv[2:], output_folder)
+        sys.exit(0)
+    elif command == "breakdown":
+        run_breakdown(sys.argv[2:])
+        sys.exit(0)
+    elif command == "serve":
+        run_service(sys.argv[2:])
+        sys.exit(0)
+    elif command == "stats":
+        run_statistics(sys.argv[2:])
+        sys.exit(0)
+    elif command == "regression":
+        run_regression_suite(sys.argv[2:])
+    elif command == "server":
+        run_server_search(sys.argv[2:])
+        sys.exit(0)
+    elif command == "pipeline":
+        run_pipeline_command(sys.argv[2:])
+        sys.exit(0)
     else:
-        print("Unknown command. Use 'run' or 'clean'")
+        print("Unknown command. Use 'run', 'clean', 'experiment', 'breakdown', 'serve', 'stats', 'regression', 'server' or 'pipeline'")
         sys.exit(1)
-    return csv_path, output_folder
+    return csv_path, output_folder, options
 
 if __name__ == '__main__':
-    csv_path, output_folder = parse_args()
+    csv_path, output_folder, options = parse_args()
 
     requirements = TaskRequirements.from_csv(csv_path)
 
-    generator = TaskGenerator(requirements, output_folder)
+    # --profile alone reports the top 20 functions, --profile N the top N
+    profile_top = None
+    if "profile" in options:
+        profile_top = 20 if options["profile"] is True else int(options["profile"])
+
+    generator = TaskGenerator(requirements, output_folder, unique_sets=options.get("unique-sets") is True, profile_top=profile_top)
     
     generator.generate_tasksets()
\ No newline at end of file
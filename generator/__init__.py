@@ -1,2 +1,7 @@
 from .task_generator import TaskGenerator
-from .task_requirements import TaskRequirements, Requirement
\ No newline at end of file
+from .task_requirements import TaskRequirements, Requirement
+from .experiment import SchedulabilityExperiment, ExperimentPoint
+from .service import GenerationService, request_tasksets
+from .corpus_stats import CorpusStatistics, collect_statistics
+from .profiling import GenerationProfile
+from .shared_pipeline import TasksetRing, PipelineResult, run_pipeline
@@ -0,0 +1,294 @@
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Iterator, Optional
+from model import TaskSet
+from .task_generator import TaskGenerator
+
+class Histogram:
+    '''
+    A fixed-bin histogram over [low, high] with underflow and overflow counts. Mergeable.
+
+    The last bin includes high, so values at the upper end of the range (e.g. a task utilization
+    of exactly 1) are counted in it rather than as overflow.
+    '''
+
+    def __init__(self, low: float, high: float, bins: int):
+        self.low = low
+        self.high = high
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, value: float) -> None:
+        if value < self.low:
+            self.underflow += 1
+        elif value > self.high:
+            self.overflow += 1
+        else:
+            bins = len(self.counts)
+            self.counts[min(bins - 1, int((value - self.low) / (self.high - self.low) * bins))] += 1
+
+    def merge(self, other: 'Histogram') -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    def render(self, width: int = 40) -> str:
+        '''
+        Render the histogram as text, one line per bin, leaving out empty bins at both ends.
+        '''
+
+        step = (self.high - self.low) / len(self.counts)
+        largest = max(self.counts + [self.underflow, self.overflow, 1])
+        used = [i for i, count in enumerate(self.counts) if count]
+        lines = []
+        if self.underflow:
+            lines.append(f"  {'<' + format(self.low, 'g'):>13} {self.underflow:>9} {'#' * round(width * self.underflow / largest)}")
+        for i in range(used[0], used[-1] + 1) if used else []:
+            count = self.counts[i]
+            low = self.low + i * step
+            label = f"[{low:.2f}, {low + step:.2f}{']' if i == len(self.counts) - 1 else ')'}"
+            lines.append(f"  {label:>13} {count:>9} {'#' * round(width * count / largest)}")
+        if self.overflow:
+            lines.append(f"  {'>' + format(self.high, 'g'):>13} {self.overflow:>9} {'#' * round(width * self.overflow / largest)}")
+        return "\n".join(lines)
+
+class QuantileSketch:
+    '''
+    A mergeable quantile sketch with relative accuracy (DDSketch, Masson et al.).
+
+    Positive values are counted in logarithmic buckets, so the memory depends on the range of
+    the values and the accuracy, not on the number of values. Quantiles are returned within the
+    given relative error.
+    '''
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values.")
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value == 0:
+            self.zeros += 1
+        else:
+            key = math.ceil(math.log(value, self.gamma))
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracies.")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def quantile(self, q: float) -> float:
+        '''
+        Estimate the q-quantile (0 <= q <= 1) of the added values.
+        '''
+
+        if self.count == 0:
+            return math.nan
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                estimate = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+class CorpusStatistics:
+    '''
+    Summary statistics over a corpus of tasksets, computed in one streaming pass.
+
+    Every statistic is a counter or a mergeable sketch, so corpora of any size are summarized in
+    constant memory and partial statistics from worker processes are merged into one.
+    '''
+
+    QUANTILES = (0.0, 0.5, 0.9, 0.99, 1.0)
+
+    def __init__(self):
+        self.tasksets = 0
+        self.tasks = 0
+        self.skipped = 0
+        self.unique_period_sets = 0
+        self.utilization_deviation = QuantileSketch()
+        self.hyperperiod = QuantileSketch()
+        self.task_utilization = Histogram(0.0, 1.0, 20)
+        self.bcet_wcet_ratio = Histogram(0.0, 1.0, 20)
+        self.bcet_wcet_quantiles = QuantileSketch()
+
+    def add(self, taskset: TaskSet, requested_utilization: Optional[float] = None) -> None:
+        '''
+        Add one taskset to the statistics.
+
+        Parameters:
+            taskset (TaskSet): The taskset.
+            requested_utilization (float): The utilization it was generated for, if known.
+        '''
+
+        checks = TaskGenerator.check_taskset(taskset, requested_utilization)
+        self.tasksets += 1
+        self.tasks += len(taskset)
+        if checks['unique_periods']:
+            self.unique_period_sets += 1
+        if checks['utilization_deviation'] is not None:
+            self.utilization_deviation.add(checks['utilization_deviation'])
+        self.hyperperiod.add(checks['hyperperiod'])
+        for task in taskset:
+            self.task_utilization.add(task.wcet / task.period)
+            if task.wcet > 0:
+                ratio = task.bcet / task.wcet
+                self.bcet_wcet_ratio.add(ratio)
+                self.bcet_wcet_quantiles.add(ratio)
+
+    def merge(self, other: 'CorpusStatistics') -> None:
+        self.tasksets += other.tasksets
+        self.tasks += other.tasks
+        self.skipped += other.skipped
+        self.unique_period_sets += other.unique_period_sets
+        self.utilization_deviation.merge(other.utilization_deviation)
+        self.hyperperiod.merge(other.hyperperiod)
+        self.task_utilization.merge(other.task_utilization)
+        self.bcet_wcet_ratio.merge(other.bcet_wcet_ratio)
+        self.bcet_wcet_quantiles.merge(other.bcet_wcet_quantiles)
+
+    def report(self) -> str:
+        '''
+        Format the statistics as a text report.
+        '''
+
+        def quantiles(sketch: QuantileSketch, fmt: str) -> str:
+            if sketch.count == 0:
+                return "n/a"
+            values = "  ".join(f"p{round(q * 100)}={format(sketch.quantile(q), fmt)}" for q in self.QUANTILES)
+            return f"{values}  mean={format(sketch.mean, fmt)}"
+
+        unique_rate = self.unique_period_sets / self.tasksets if self.tasksets else 0.0
+        lines = [
+            f"{'='*40}",
+            f"Tasksets: {self.tasksets}",
+            f"Tasks: {self.tasks}",
+            f"Skipped unreadable files: {self.skipped}",
+            f"Unique periods rate: {unique_rate:.3f}",
+            f"Utilization deviation ({self.utilization_deviation.count} with known request): "
+            f"{quantiles(self.utilization_deviation, '.3f')}",
+            f"Hyperperiod: {quantiles(self.hyperperiod, '.4g')}",
+            f"BCET/WCET ratio: {quantiles(self.bcet_wcet_quantiles, '.3f')}",
+            "BCET/WCET ratio histogram:",
+            self.bcet_wcet_ratio.render(),
+            "Per-task utilization histogram:",
+            self.task_utilization.render(),
+            f"{'='*40}",
+        ]
+        return "\n".join(lines)
+
+def iter_corpus(path: str) -> Iterator[str]:
+    '''
+    Lazily list the taskset CSV files of a corpus. CSV files in a folder whose header is not a
+    taskset header, such as analysis results, are left out; paths from a listing are yielded as
+    given, and files that cannot be read are counted as skipped by collect_statistics.
+
+    Parameters:
+        path (str): A folder searched recursively, a taskset CSV file, or a text file listing
+                    one taskset CSV path per line.
+
+    Yields:
+        str: The path of each taskset CSV file.
+    '''
+
+    if os.path.isdir(path):
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            for name in sorted(names):
+                if name.endswith('.csv') and TaskSet.is_csv(os.path.join(root, name)):
+                    yield os.path.join(root, name)
+    elif path.endswith('.csv'):
+        yield path
+    else:
+        with open(path, mode='r') as file:
+            for line in file:
+                if line.strip():
+                    yield line.strip()
+
+def requested_utilization(file_path: str) -> Optional[float]:
+    '''
+    Recover the requested utilization from the "<utilization>_utilization" output folder, if any.
+    '''
+
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)_utilization', os.path.basename(os.path.dirname(file_path)))
+    return float(match.group(1)) if match else None
+
+def collect_statistics(path: str, workers: Optional[int] = None, chunk_size: int = 256) -> CorpusStatistics:
+    '''
+    Compute the statistics of a corpus in a single streaming pass over a pool of worker processes.
+
+    The files are handed out in chunks with a bounded number of chunks in flight, and each worker
+    returns the statistics of its chunk, so memory does not grow with the size of the corpus.
+
+    Parameters:
+        path (str): The corpus (see iter_corpus).
+        workers (int): The number of worker processes (default: number of CPUs).
+        chunk_size (int): The number of files per chunk (default: 256).
+
+    Returns:
+        CorpusStatistics: The merged statistics.
+    '''
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    statistics = CorpusStatistics()
+    files = iter_corpus(path)
+    in_flight = set()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while len(in_flight) < 2 * workers:
+                chunk = [f for _, f in zip(range(chunk_size), files)]
+                if not chunk:
+                    break
+                in_flight.add(pool.submit(_collect_chunk, chunk))
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                statistics.merge(future.result())
+    return statistics
+
+def _collect_chunk(files: list[str]) -> CorpusStatistics:
+    statistics = CorpusStatistics()
+    for file_path in files:
+        try:
+            taskset = TaskSet.from_csv(file_path)
+        except (OSError, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            # Missing, truncated or malformed files are counted instead of failing the whole pass
+            statistics.skipped += 1
+            continue
+        statistics.add(taskset, requested_utilization(file_path))
+    return statistics
@@ -0,0 +1,204 @@
+import csv
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from math import sqrt
+from statistics import NormalDist
+from typing import Optional
+from .task_requirements import TaskRequirements, Requirement
+from .task_generator import TaskGenerator
+from .workers import seed_worker
+from scheduling import SchedulingAlgorithm, RateMonotonic, ResponseTimeAnalysis
+
+class ExperimentPoint:
+    '''
+    A single (size, utilization) point of a schedulability-ratio sweep.
+
+    Attributes
+    ----------
+    size : int
+        The number of tasks per generated taskset.
+    utilization : float
+        The requested utilization of the generated tasksets.
+    samples : int
+        The number of tasksets analyzed so far.
+    schedulable : int
+        The number of analyzed tasksets that were schedulable.
+    error : str
+        The generation error, if the point cannot be sampled (default: None).
+    '''
+
+    def __init__(self, size: int, utilization: float):
+        self.size = size
+        self.utilization = utilization
+        self.samples = 0
+        self.schedulable = 0
+        self.error = None
+
+    @property
+    def ratio(self) -> float:
+        return self.schedulable / self.samples if self.samples else 0.0
+
+    def confidence_interval(self, confidence: float) -> tuple[float, float]:
+        '''
+        Wilson score interval of the schedulability ratio.
+
+        Parameters:
+            confidence (float): The confidence level, e.g. 0.95.
+
+        Returns:
+            tuple[float, float]: The lower and upper bound of the interval.
+        '''
+
+        if self.samples == 0:
+            return 0.0, 1.0
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        n = self.samples
+        p = self.ratio
+        denominator = 1 + z * z / n
+        center = (p + z * z / (2 * n)) / denominator
+        half_width = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+        return max(0.0, center - half_width), min(1.0, center + half_width)
+
+    def __repr__(self):
+        return (f"ExperimentPoint(size={self.size}, utilization={self.utilization}, "
+                f"samples={self.samples}, schedulable={self.schedulable})")
+
+class SchedulabilityExperiment:
+    '''
+    Sweep utilization and taskset size and estimate the fraction of schedulable tasksets.
+
+    Tasksets are generated and analyzed in memory by a pool of worker processes. Each point
+    is sampled in batches until the confidence interval of its schedulability ratio is
+    narrower than the requested width, or until max_samples tasksets have been analyzed.
+    '''
+
+    def __init__(self,
+                 sizes: list[int],
+                 utilizations: list[float],
+                 unique_periods: bool = False,
+                 algorithm: SchedulingAlgorithm = None,
+                 width: float = 0.05,
+                 confidence: float = 0.95,
+                 batch_size: int = 50,
+                 max_samples: int = 10000,
+                 workers: Optional[int] = None,
+                 seed: Optional[int] = None
+    ):
+        self.sizes = sizes
+        self.utilizations = utilizations
+        self.unique_periods = unique_periods
+        self.algorithm = algorithm if algorithm is not None else RateMonotonic()
+        self.width = width
+        self.confidence = confidence
+        self.batch_size = batch_size
+        self.max_samples = max_samples
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.seed = seed
+        self.points = [ExperimentPoint(size, u) for size in sizes for u in utilizations]
+
+    def run(self) -> list[ExperimentPoint]:
+        '''
+        Run the sweep until every point has converged or reached max_samples.
+
+        Returns:
+            list[ExperimentPoint]: The sampled points, in sweep order.
+        '''
+
+        seeds = random.Random(self.seed)
+        in_flight = {}
+        pending = {id(point): 0 for point in self.points}
+        capacity = 2 * self.workers
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                # Spread batches over the open points so all workers stay busy without
+                # oversampling points that are about to converge
+                open_points = [
+                    p for p in self.points
+                    if not self.__is_done(p) and p.samples + pending[id(p)] < self.max_samples
+                ]
+                if open_points:
+                    per_point = max(1, -(-capacity // len(open_points)))
+                    for point in open_points:
+                        batches = sum(1 for p, _ in in_flight.values() if p is point)
+                        while len(in_flight) < capacity and batches < per_point:
+                            # Never request more than the point still needs to reach max_samples
+                            count = min(self.batch_size, self.max_samples - point.samples - pending[id(point)])
+                            if count <= 0:
+                                break
+                            requirement = Requirement(
+                                f"Experiment_{point.size}_{point.utilization}",
+                                point.size, point.utilization, self.unique_periods, self.algorithm
+                            )
+                            future = pool.submit(_sample_batch, requirement, count, seeds.getrandbits(64))
+                            in_flight[future] = (point, count)
+                            pending[id(point)] += count
+                            batches += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    point, count = in_flight.pop(future)
+                    pending[id(point)] -= count
+                    try:
+                        schedulable, samples = future.result()
+                    except ValueError as e:
+                        point.error = str(e)
+                        continue
+                    point.samples += samples
+                    point.schedulable += schedulable
+
+        return self.points
+
+    def to_csv(self, file_path: str) -> None:
+        '''
+        Write the sampled points as a compact table.
+
+        Parameters:
+            file_path (str): The path of the CSV file to write.
+        '''
+
+        folder = os.path.dirname(file_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        headers = ['Size', 'Utilization', 'Samples', 'Schedulable', 'Ratio', 'Lower', 'Upper', 'Error']
+        with open(file_path, 'w', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=headers)
+            writer.writeheader()
+            for point in self.points:
+                lower, upper = point.confidence_interval(self.confidence)
+                writer.writerow({
+                    'Size': point.size,
+                    'Utilization': point.utilization,
+                    'Samples': point.samples,
+                    'Schedulable': point.schedulable,
+                    'Ratio': f"{point.ratio:.4f}",
+                    'Lower': f"{lower:.4f}",
+                    'Upper': f"{upper:.4f}",
+                    'Error': point.error or '',
+                })
+
+    def __is_done(self, point: ExperimentPoint) -> bool:
+        if point.error is not None or point.samples >= self.max_samples:
+            return True
+        if point.samples == 0:
+            return False
+        lower, upper = point.confidence_interval(self.confidence)
+        return upper - lower <= self.width
+
+def _sample_batch(req: Requirement, count: int, seed: int) -> tuple[int, int]:
+    '''
+    Generate and analyze a batch of tasksets in a worker process.
+
+    Returns:
+        tuple[int, int]: The number of schedulable tasksets and the batch size.
+    '''
+
+    seed_worker(seed)
+    generator = TaskGenerator(TaskRequirements([req]), None)
+    tasksets = generator.generate_batch(req, count)
+    schedulable = sum(1 for taskset in tasksets if ResponseTimeAnalysis(taskset).is_schedulable())
+    return schedulable, count
@@ -0,0 +1,51 @@
+import os
+
+class FingerprintIndex:
+    '''
+    A persistent set of taskset fingerprints (see TaskSet.fingerprint).
+
+    Fingerprints are kept in memory for O(1) lookups and appended to a text file, one per
+    line, so duplicates are also detected across generation runs.
+
+    Attributes
+    ----------
+    path : str
+        The file backing the index.
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self.fingerprints = set()
+        if os.path.exists(path):
+            with open(path, mode='r') as file:
+                self.fingerprints = {line.strip() for line in file if line.strip()}
+
+    def add(self, fingerprint: str) -> bool:
+        '''
+        Add a fingerprint to the index.
+
+        Parameters:
+            fingerprint (str): The fingerprint to add.
+
+        Returns:
+            bool: False if the fingerprint was already in the index, True otherwise.
+        '''
+
+        if fingerprint in self.fingerprints:
+            return False
+        self.fingerprints.add(fingerprint)
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.path, mode='a') as file:
+            file.write(fingerprint + '\n')
+        return True
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.fingerprints
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def __repr__(self):
+        return f"FingerprintIndex(path={self.path}, size={len(self.fingerprints)})"
@@ -0,0 +1,85 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+class GenerationProfile:
+    '''
+    Records a cProfile profile, the wall time and the tracemalloc peak memory of a block of code.
+
+    Used as a context manager around the generation of one requirement:
+
+        with GenerationProfile() as profile:
+            taskset = generator.generate_taskset(req)
+        profile.save(folder, f"{req.name}_taskset")
+
+    Attributes
+    ----------
+    top : int
+        The number of functions listed in the text summary.
+    elapsed : float
+        The wall time of the block, in seconds.
+    peak_memory : int
+        The peak traced memory during the block, in bytes.
+    '''
+
+    def __init__(self, top: int = 20):
+        self.top = top
+        self.elapsed = 0.0
+        self.peak_memory = 0
+        self.profiler = cProfile.Profile()
+        self.__started_tracing = False
+        self.__start = 0.0
+
+    def __enter__(self) -> 'GenerationProfile':
+        # Leave tracemalloc running if someone else started it
+        self.__started_tracing = not tracemalloc.is_tracing()
+        if self.__started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self.__start = time.perf_counter()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.disable()
+        self.elapsed = time.perf_counter() - self.__start
+        _, self.peak_memory = tracemalloc.get_traced_memory()
+        if self.__started_tracing:
+            tracemalloc.stop()
+
+    def summary(self) -> str:
+        '''
+        Format the wall time, the peak memory and the top functions by total and cumulative time.
+        '''
+
+        stream = io.StringIO()
+        stream.write(f"Wall time: {self.elapsed:.3f} s\n")
+        stream.write(f"Peak memory (tracemalloc): {self.peak_memory / 1024:.1f} KiB\n")
+        for sort_key, label in ((pstats.SortKey.TIME, "total"), (pstats.SortKey.CUMULATIVE, "cumulative")):
+            stream.write(f"\nTop {self.top} functions by {label} time:\n")
+            pstats.Stats(self.profiler, stream=stream).sort_stats(sort_key).print_stats(self.top)
+        return stream.getvalue()
+
+    def save(self, folder: str, file_name: str) -> tuple[str, str]:
+        '''
+        Write the raw profile (<file_name>.prof, readable with pstats or snakeviz) and the text
+        summary (<file_name>_profile.txt) to a folder.
+
+        Parameters:
+            folder (str): The output folder.
+            file_name (str): The base name of both files.
+
+        Returns:
+            tuple[str, str]: The paths of the profile and of the summary.
+        '''
+
+        os.makedirs(folder, exist_ok=True)
+        profile_path = os.path.join(folder, f"{file_name}.prof")
+        summary_path = os.path.join(folder, f"{file_name}_profile.txt")
+        self.profiler.dump_stats(profile_path)
+        with open(summary_path, 'w') as file:
+            file.write(self.summary())
+        return profile_path, summary_path
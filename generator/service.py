@@ -0,0 +1,198 @@
+import asyncio
+import io
+import json
+import os
+import socket
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from .task_requirements import TaskRequirements, Requirement
+from .task_generator import TaskGenerator
+from .workers import seed_worker
+
+class GenerationService:
+    '''
+    A long-running local taskset generation service.
+
+    Clients connect over a Unix socket or localhost TCP and send one JSON request per line:
+
+        {"id": 1, "format": "json", "requirements": [{"Name": "A", "Size": 5, "Utilization": 0.5,
+                                                      "UniquePeriods": false, "PriorityAssignment": "RM"}]}
+
+    The requirements of a request form a batch that is dispatched to a pool of pre-warmed worker
+    processes. Each taskset is streamed back as its own JSON line as soon as it is generated,
+    followed by a final {"id": ..., "done": true} line. The "format" is "json" (a list of task
+    rows, as in the CSV columns) or "csv" (the CSV file contents as a string).
+
+    Attributes
+    ----------
+    workers : int
+        The number of worker processes.
+    '''
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.pool = None
+        self.__socket_path = None
+
+    async def start(self) -> None:
+        '''
+        Start the worker pool and wait until every worker has imported the generator.
+        '''
+
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _warm_up) for _ in range(self.workers)))
+
+    def close(self) -> None:
+        '''
+        Stop the worker pool and remove the Unix socket the service listened on.
+        '''
+
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+        if self.__socket_path is not None:
+            if self.__is_socket(self.__socket_path):
+                os.remove(self.__socket_path)
+            self.__socket_path = None
+
+    async def serve_unix(self, path: str) -> asyncio.AbstractServer:
+        '''
+        Listen on a Unix socket. A socket left behind by an earlier run is replaced, but any other
+        file at the path is kept and FileExistsError is raised.
+
+        Parameters:
+            path (str): The path of the socket.
+
+        Returns:
+            asyncio.AbstractServer: The server, not yet serving forever.
+        '''
+
+        if os.path.lexists(path):
+            if not self.__is_socket(path):
+                raise FileExistsError(f"{path} exists and is not a socket.")
+            os.remove(path)
+        server = await asyncio.start_unix_server(self.handle_connection, path=path)
+        self.__socket_path = path
+        return server
+
+    async def serve_tcp(self, host: str, port: int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host=host, port=port)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await self.handle_request(line, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        '''
+        Generate the tasksets of one request and stream them back, one JSON line per taskset.
+
+        Parameters:
+            line (bytes): The JSON encoded request.
+            writer (asyncio.StreamWriter): The stream to write the responses to.
+        '''
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            output_format = request.get('format', 'json')
+            if output_format not in ('json', 'csv'):
+                raise ValueError("Format must be 'json' or 'csv'.")
+            requirements = [Requirement.from_row(row) for row in request['requirements']]
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            await self.__send(writer, {'id': request_id, 'error': f"Invalid request: {e}", 'done': True})
+            return
+
+        loop = asyncio.get_running_loop()
+
+        async def generate(index: int, req: Requirement) -> dict:
+            response = {'id': request_id, 'index': index, 'name': req.name}
+            try:
+                response['taskset'] = await loop.run_in_executor(self.pool, _generate, req, output_format)
+            except Exception as e:
+                response['error'] = str(e)
+            return response
+
+        for response in asyncio.as_completed([generate(i, req) for i, req in enumerate(requirements)]):
+            await self.__send(writer, await response)
+        await self.__send(writer, {'id': request_id, 'done': True})
+
+    @staticmethod
+    def __is_socket(path: str) -> bool:
+        try:
+            return stat.S_ISSOCK(os.lstat(path).st_mode)
+        except FileNotFoundError:
+            return False
+
+    async def __send(self, writer: asyncio.StreamWriter, response: dict) -> None:
+        writer.write(json.dumps(response).encode() + b'\n')
+        await writer.drain()
+
+def request_tasksets(requirements: list[dict],
+                     socket_path: Optional[str] = None,
+                     host: str = '127.0.0.1',
+                     port: Optional[int] = None,
+                     output_format: str = 'json') -> list[dict]:
+    '''
+    Send one batch of requirements to a running GenerationService and collect the responses.
+
+    Parameters:
+        requirements (list[dict]): The requirements, keyed by the configuration file columns.
+        socket_path (str): The Unix socket of the service.
+        host (str): The host of the service when using TCP (default: 127.0.0.1).
+        port (int): The port of the service when using TCP.
+        output_format (str): "json" or "csv" (default: "json").
+
+    Returns:
+        list[dict]: One response per requirement, ordered as the requirements.
+    '''
+
+    if socket_path is not None:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(socket_path)
+    else:
+        connection = socket.create_connection((host, port))
+
+    with connection, connection.makefile('rwb') as stream:
+        request = {'id': 0, 'format': output_format, 'requirements': requirements}
+        stream.write(json.dumps(request).encode() + b'\n')
+        stream.flush()
+        responses = []
+        for line in stream:
+            response = json.loads(line)
+            if response.get('done'):
+                if 'error' in response:
+                    raise ValueError(response['error'])
+                break
+            responses.append(response)
+    return sorted(responses, key=lambda response: response['index'])
+
+_generator = None
+
+def _init_worker() -> None:
+    global _generator
+    seed_worker()
+    _generator = TaskGenerator(TaskRequirements([]), None)
+
+def _warm_up() -> None:
+    pass
+
+def _generate(req: Requirement, output_format: str):
+    taskset = _generator.generate_taskset(req)
+    if output_format == 'csv':
+        stream = io.StringIO()
+        taskset.write_csv(stream)
+        return stream.getvalue()
+    return taskset.to_rows()
@@ -0,0 +1,276 @@
+import multiprocessing
+from array import array
+import os
+import queue
+import random
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+from model import Task, TaskSet, TaskType, Criticality
+from scheduling import ResponseTimeAnalysis
+from .task_requirements import TaskRequirements, Requirement
+from .task_generator import TaskGenerator
+from .workers import seed_worker
+
+class TasksetRing:
+    '''
+    A bounded ring buffer of tasksets in shared memory, for handing tasksets between processes
+    without pickling or CSV files.
+
+    Each slot holds one taskset as fixed-width int64 values: a header with the task count and a
+    tag chosen by the producer, followed by FIELDS for every task. Two semaphores count the free
+    and the filled slots, so producers block while the ring is full (backpressure) and consumers
+    block while it is empty. Slots are claimed in order under a lock per side, and only the raw
+    integers are copied under the lock; encoding and decoding the task objects happen outside it.
+    A reader gets its own TaskSet rather than a view of the slot, since the slot is handed back to
+    the producers as soon as it has been copied.
+
+    A slot with a negative task count is a sentinel telling one consumer to stop.
+
+    Attributes
+    ----------
+    slots : int
+        The number of tasksets the ring holds.
+    max_tasks : int
+        The largest taskset a slot can hold.
+    '''
+
+    FIELDS = ('bcet', 'wcet', 'period', 'deadline', 'priority', 'MIT', 'task_type', 'wcet_hi', 'criticality')
+    HEADER = 2
+    SENTINEL = -1
+
+    def __init__(self, slots: int, max_tasks: int, context=None):
+        if slots < 1 or max_tasks < 1:
+            raise ValueError("The ring needs at least one slot and one task per slot.")
+        context = context if context is not None else multiprocessing.get_context()
+        self.slots = slots
+        self.max_tasks = max_tasks
+        self.slot_size = self.HEADER + max_tasks * len(self.FIELDS)
+        self.memory = shared_memory.SharedMemory(create=True, size=slots * self.slot_size * 8)
+        self.free = context.Semaphore(slots)
+        self.filled = context.Semaphore(0)
+        self.head = context.Value('q', 0)  # Next slot to write, guarded by its own lock
+        self.tail = context.Value('q', 0)  # Next slot to read
+        self.__owner = True
+        self.__attach()
+
+    def __attach(self) -> None:
+        self.values = self.memory.buf.cast('q')
+
+    def __getstate__(self) -> dict:
+        # Processes started with spawn re-attach to the shared memory by name
+        state = self.__dict__.copy()
+        del state['values']
+        state['_TasksetRing__owner'] = False
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__attach()
+
+    def put(self, taskset: TaskSet, tag: int = 0) -> None:
+        '''
+        Write a taskset into the next free slot, blocking while the ring is full.
+
+        Parameters:
+            taskset (TaskSet): The taskset. Every field must be an integer.
+            tag (int): A value returned with the taskset by get (default: 0).
+        '''
+
+        if len(taskset) > self.max_tasks:
+            raise ValueError(f"Taskset of {len(taskset)} tasks does not fit in slots of {self.max_tasks} tasks.")
+        record = [len(taskset), tag]
+        for task in taskset:
+            record.extend((task.bcet, task.wcet, task.period, task.deadline, task.priority,
+                           task.MIT, 1 if task.task_type == TaskType.ET else 0,
+                           task.wcet_hi, 1 if task.criticality == Criticality.HI else 0))
+        if any(value != int(value) for value in record):
+            raise ValueError("Only tasksets with integer fields can be shared.")
+        self.__write([int(value) for value in record])
+
+    def put_sentinel(self, timeout: Optional[float] = None) -> bool:
+        '''
+        Tell one consumer to stop once it has read everything written before.
+
+        Parameters:
+            timeout (float): Give up after this many seconds while the ring is full (default: wait forever).
+
+        Returns:
+            bool: Whether the sentinel was written.
+        '''
+
+        return self.__write([self.SENTINEL, 0], timeout)
+
+    def get(self) -> Optional[tuple[int, TaskSet]]:
+        '''
+        Read the oldest taskset, blocking while the ring is empty.
+
+        Returns:
+            tuple[int, TaskSet]: The tag and the taskset, None for a sentinel.
+        '''
+
+        self.filled.acquire()
+        # Slots are freed in order through one semaphore, so the copy must finish under the lock:
+        # otherwise a later consumer could free a slot while this one is still copying an older one,
+        # letting a producer overwrite it. Building the task objects happens outside the lock.
+        with self.tail.get_lock():
+            start = self.tail.value * self.slot_size
+            self.tail.value = (self.tail.value + 1) % self.slots
+            count = self.values[start]
+            record = self.values[start:start + self.HEADER + max(count, 0) * len(self.FIELDS)].tolist()
+        self.free.release()
+        if count == self.SENTINEL:
+            return None
+        return record[1], self.__decode(record)
+
+    def close(self) -> None:
+        '''
+        Detach from the shared memory; the process that created the ring also frees it.
+        '''
+
+        self.values.release()
+        self.memory.close()
+        if self.__owner:
+            self.memory.unlink()
+
+    def __decode(self, record: list[int]) -> TaskSet:
+        taskset = TaskSet()
+        fields = len(self.FIELDS)
+        for i in range(record[0]):
+            offset = self.HEADER + i * fields
+            bcet, wcet, period, deadline, priority, mit, et, wcet_hi, hi = record[offset:offset + fields]
+            taskset.add_task(Task(f"Task_{i}", bcet, wcet, period, deadline, priority,
+                                  task_type=TaskType.ET if et else TaskType.TT, MIT=mit,
+                                  criticality=Criticality.HI if hi else Criticality.LO, wcet_hi=wcet_hi))
+        return taskset
+
+    def __write(self, record: list[int], timeout: Optional[float] = None) -> bool:
+        if not self.free.acquire(timeout=timeout):
+            return False
+        with self.head.get_lock():
+            start = self.head.value * self.slot_size
+            self.head.value = (self.head.value + 1) % self.slots
+            self.values[start:start + len(record)] = array('q', record)
+        self.filled.release()
+        return True
+
+class PipelineResult:
+    '''
+    The outcome of a generate-then-analyze pipeline run.
+
+    Attributes:
+        generated (int): The number of tasksets generated.
+        schedulable (int): The number of schedulable tasksets.
+        elapsed (float): The wall time of the run, in seconds.
+    '''
+
+    def __init__(self, generated: int, schedulable: int, elapsed: float) -> None:
+        self.generated = generated
+        self.schedulable = schedulable
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self) -> float:
+        return self.generated / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self):
+        return f"PipelineResult(generated={self.generated}, schedulable={self.schedulable}, elapsed={self.elapsed:.3f})"
+
+def run_pipeline(req: Requirement,
+                 count: int,
+                 producers: Optional[int] = None,
+                 consumers: Optional[int] = None,
+                 slots: int = 64,
+                 batch_size: int = 16,
+                 seed: Optional[int] = None) -> PipelineResult:
+    '''
+    Generate tasksets in producer processes and check their schedulability (response time analysis)
+    in consumer processes, handing them over through a TasksetRing.
+
+    Producers generate batches and block while the ring is full; once they are done, one sentinel
+    per consumer is written so every consumer stops after the tasksets before it. The shared memory
+    is freed even if a worker fails.
+
+    Parameters:
+        req (Requirement): The requirement of the generated tasksets.
+        count (int): The number of tasksets.
+        producers (int): The number of generator processes (default: half of the CPUs).
+        consumers (int): The number of analysis processes (default: the remaining CPUs).
+        slots (int): The capacity of the ring, in tasksets (default: 64).
+        batch_size (int): The number of tasksets a producer generates at once (default: 16).
+        seed (int): Seed of the producers, for reproducible tasksets (default: random).
+
+    Returns:
+        PipelineResult: The number of generated and schedulable tasksets and the wall time.
+    '''
+
+    cpus = os.cpu_count() or 2
+    producers = producers if producers is not None else max(1, cpus // 2)
+    consumers = consumers if consumers is not None else max(1, cpus - producers)
+    seeds = random.Random(seed).sample(range(2 ** 32), producers)
+    context = multiprocessing.get_context()
+
+    start = time.perf_counter()
+    ring = TasksetRing(slots, req.size, context)
+    results = context.Queue()
+    workers = []
+    try:
+        consumer_processes = [context.Process(target=_consume, args=(ring, results)) for _ in range(consumers)]
+        producer_processes = [
+            context.Process(target=_produce, args=(ring, req, count // producers + (i < count % producers), batch_size, seeds[i]))
+            for i in range(producers)
+        ]
+        workers = consumer_processes + producer_processes
+        for process in workers:
+            process.start()
+
+        # Every wait polls the consumers, so a failed consumer cannot leave the others blocked on the ring
+        for process in producer_processes:
+            while process.is_alive():
+                _check_consumers(consumer_processes)
+                process.join(0.5)
+        failed = [process for process in producer_processes if process.exitcode != 0]
+        for _ in consumer_processes:
+            while not ring.put_sentinel(timeout=0.5):
+                _check_consumers(consumer_processes)
+        totals = []
+        while len(totals) < len(consumer_processes):
+            try:
+                totals.append(results.get(timeout=0.5))
+            except queue.Empty:
+                _check_consumers(consumer_processes)
+        for process in consumer_processes:
+            process.join()
+        if failed:
+            raise RuntimeError(f"{len(failed)} producer processes failed.")
+    finally:
+        for process in workers:
+            if process.is_alive():
+                process.terminate()
+        ring.close()
+
+    return PipelineResult(sum(t[0] for t in totals), sum(t[1] for t in totals), time.perf_counter() - start)
+
+def _check_consumers(consumers: list) -> None:
+    if any(process.exitcode not in (None, 0) for process in consumers):
+        raise RuntimeError("An analysis process failed.")
+
+def _produce(ring: TasksetRing, req: Requirement, count: int, batch_size: int, seed: int) -> None:
+    seed_worker(seed)
+    generator = TaskGenerator(TaskRequirements([req]), None)
+    produced = 0
+    while produced < count:
+        for taskset in generator.generate_batch(req, min(batch_size, count - produced)):
+            ring.put(taskset, produced)
+            produced += 1
+
+def _consume(ring: TasksetRing, results) -> None:
+    analyzed = schedulable = 0
+    while True:
+        item = ring.get()
+        if item is None:
+            break
+        _, taskset = item
+        analyzed += 1
+        schedulable += ResponseTimeAnalysis(taskset).is_schedulable()
+    results.put((analyzed, schedulable))
@@ -0,0 +1,570 @@
+import math
+import random
+from bisect import bisect_left
+from abc import ABC, abstractmethod
+from fractions import Fraction
+from functools import lru_cache
+from model import Task, TaskSet
+from scheduling import SchedulingAlgorithm, RateMonotonic, AMCPriorityAssignment
+
+class Stage(ABC):
+    '''
+    Base class of the generation stages.
+
+    A stage is created from the requirement it generates tasksets for: the values returned by
+    parameters() are passed to the constructor. Stages are stateless, so the generator reuses
+    one instance per implementation and parameters.
+    '''
+
+    @classmethod
+    def parameters(cls, req) -> tuple:
+        '''
+        Extract the constructor arguments of the stage from a requirement (default: none).
+
+        Parameters:
+            req (Requirement): The requirement.
+
+        Returns:
+            tuple: The hashable constructor arguments.
+        '''
+        return ()
+
+    @classmethod
+    def from_requirement(cls, req) -> 'Stage':
+        return cls(*cls.parameters(req))
+
+class UtilizationSampler(Stage):
+    '''
+    Generation stage that splits the total utilization of a taskset over its tasks.
+    '''
+
+    @abstractmethod
+    def sample(self, size: int, utilization: float, task_utilization_limit: float) -> list[float]:
+        '''
+        Generate utilization values for the tasks of one taskset.
+
+        Parameters:
+            size (int): The number of tasks.
+            utilization (float): The total utilization of the tasks.
+            task_utilization_limit (float): The maximum utilization of a task.
+
+        Returns:
+            list[float]: The utilization of each task.
+        '''
+        pass
+
+    def sample_batch(self, count: int, size: int, utilization: float, task_utilization_limit: float) -> list[list[float]]:
+        '''
+        Generate utilization values for count tasksets at once.
+
+        Returns:
+            list[list[float]]: The utilization of each task, per taskset.
+        '''
+        return [self.sample(size, utilization, task_utilization_limit) for _ in range(count)]
+
+class PeriodGenerator(Stage):
+    '''
+    Generation stage that chooses the period of every task.
+    '''
+
+    @abstractmethod
+    def generate(self, unique: bool, utilization: list[float]) -> list[int]:
+        '''
+        Generate periods for the tasks of one taskset.
+
+        Parameters:
+            unique (bool): Whether the periods should be unique.
+            utilization (list[float]): The utilization of each task.
+
+        Returns:
+            list[int]: The period of each task.
+        '''
+        pass
+
+    def generate_batch(self, unique: bool, utilizations: list[list[float]]) -> list[list[int]]:
+        '''
+        Generate periods for many tasksets at once.
+
+        Returns:
+            list[list[int]]: The period of each task, per taskset.
+        '''
+        return [self.generate(unique, utilization) for utilization in utilizations]
+
+class TaskBuilder(Stage):
+    '''
+    Generation stage that derives WCET and BCET values and builds the taskset.
+    '''
+
+    @abstractmethod
+    def build(self, utilization: list[float], periods: list[int]) -> TaskSet:
+        '''
+        Build one taskset from the utilization and period of each task.
+
+        Parameters:
+            utilization (list[float]): The utilization of each task.
+            periods (list[int]): The period of each task.
+
+        Returns:
+            TaskSet: The created taskset.
+        '''
+        pass
+
+    def build_batch(self, utilizations: list[list[float]], periods: list[list[int]]) -> list[TaskSet]:
+        '''
+        Build many tasksets at once.
+
+        Returns:
+            list[TaskSet]: The created tasksets.
+        '''
+        return [self.build(u, p) for u, p in zip(utilizations, periods)]
+
+class BaselineUtilizationSampler(UtilizationSampler):
+    '''
+    Reference sampler: every task gets a minimum utilization plus a random share of the remainder,
+    rounded to 2 decimals so the periods derived from it stay small.
+    '''
+
+    def __init__(self, min_utilization: float = 0.01):
+        self.min_utilization = min_utilization
+
+    def sample(self, size: int, utilization: float, task_utilization_limit: float) -> list[float]:
+        # Ensure the requested total utilization is enough to give each task at least 1% utilization
+        if utilization < size * self.min_utilization:
+            raise ValueError("Number of tasks and total utilization must be such that each task can have at least 1% utilization.")
+
+        # The baseline is allocated to each task
+        baseline = [self.min_utilization] * size
+        remainder = utilization - (self.min_utilization * size)
+
+        while True:
+            # Generate a random partition of the remaining utilization over the tasks
+            random_parts = [random.random() for _ in range(size)]
+            sum_random = sum(random_parts)
+            # Calculate additional utilization for each task based on the random weights
+            additions = [(part / sum_random) * remainder for part in random_parts]
+
+            # Sum baseline and addition, rounded to 2 decimals
+            utilizationValues = [round(base + add, 2) for base, add in zip(baseline, additions)]
+            # Adjust the last task to ensure the total sums exactly to the requested utilization
+            diff = round(utilization - sum(utilizationValues), 2)
+            utilizationValues[-1] = round(utilizationValues[-1] + diff, 2)
+
+            # Ensure the last task still meets the minimum utilization
+            if utilizationValues[-1] < self.min_utilization:
+                continue
+
+            # Check that no task exceeds the provided taskUtilizationLimit
+            if all(u <= task_utilization_limit for u in utilizationValues):
+                break
+
+        return utilizationValues
+
+class UUniFastSampler(UtilizationSampler):
+    '''
+    UUniFast-Discard sampler (Bini & Buttazzo; Davis & Burns): uniformly distributed utilization
+    vectors, discarding vectors with a task below the minimum or above the limit. Values are
+    rounded to 2 decimals like the reference sampler.
+    '''
+
+    MAX_ATTEMPTS = 10000
+
+    def __init__(self, min_utilization: float = 0.01):
+        self.min_utilization = min_utilization
+
+    def sample(self, size: int, utilization: float, task_utilization_limit: float) -> list[float]:
+        if utilization < size * self.min_utilization:
+            raise ValueError("Number of tasks and total utilization must be such that each task can have at least 1% utilization.")
+
+        for _ in range(self.MAX_ATTEMPTS):
+            values = []
+            remaining = utilization
+            for i in range(1, size):
+                next_remaining = remaining * random.random() ** (1 / (size - i))
+                values.append(round(remaining - next_remaining, 2))
+                remaining = next_remaining
+            # The last task takes whatever is left so the total is exact after rounding
+            values.append(round(utilization - sum(values), 2))
+
+            if all(self.min_utilization <= u <= task_utilization_limit for u in values):
+                return values
+        raise ValueError("Could not sample utilization values within the per-task limits.")
+
+class UtilizationDenominatorPeriods(PeriodGenerator):
+    '''
+    Reference period generator: the period of a task is the smallest integer that makes its WCET
+    an integer for its utilization. Duplicates are scaled up by 2 or 3 when unique periods are requested.
+    '''
+
+    def generate(self, unique: bool, utilization: list[float]) -> list[int]:
+
+        def scale_up_duplicates(periods: list[int]) -> None:
+            '''
+            Scale up the periods of tasks that have the same period to make them unique.
+            '''
+            duplicates = {}
+            for idx, p in enumerate(periods):
+                duplicates.setdefault(p, []).append(idx)
+            for p, indices in duplicates.items():
+                if len(indices) > 1:
+                    for i in indices[1:]:
+                        scale_factor = random.randint(2, 3)
+                        periods[i] = periods[i] * scale_factor
+
+        periods = [ find_integer_n(u) for u in utilization ]
+        # Ensure periods are unique if requested
+        if unique:
+            while len(set(periods)) != len(periods):
+                scale_up_duplicates(periods)
+
+        return periods
+
+class LogUniformPeriods(PeriodGenerator):
+    '''
+    Periods drawn log-uniformly from [period_min, period_max], rounded to multiples of the granularity
+    (Emberson et al.). Each multiple gets the log-uniform mass of the values that round to it.
+
+    Every task only draws among the periods that give it a WCET of at least 1 (see shortest_period),
+    so no WCET has to be clamped up and the taskset keeps its requested utilization.
+    '''
+
+    def __init__(self, period_min: int, period_max: int, granularity: int = 1):
+        if period_min is None or period_max is None:
+            raise ValueError("Log-uniform periods need the PeriodMin and PeriodMax columns.")
+        if granularity < 1 or period_min < 1 or period_max < period_min:
+            raise ValueError("Log-uniform periods need 1 <= PeriodMin <= PeriodMax and PeriodGranularity >= 1.")
+        self.pool = log_uniform_pool(period_min, period_max, granularity)
+
+    @classmethod
+    def parameters(cls, req) -> tuple:
+        return (req.period_min, req.period_max, req.period_granularity)
+
+    def generate(self, unique: bool, utilization: list[float]) -> list[int]:
+        minimums = [shortest_period(u) for u in utilization]
+        if unique:
+            return self.pool.sample_unique(len(utilization), minimums)
+        return [self.pool.sample(minimum) for minimum in minimums]
+
+class ListPeriods(PeriodGenerator):
+    '''
+    Periods chosen uniformly from a user-supplied list, e.g. the automotive periods 1;2;5;10;20;50;100;200;1000.
+
+    As for log-uniform periods, every task only draws among the listed periods long enough for its
+    utilization; a task whose utilization is too small for every listed period gets the longest one.
+    '''
+
+    def __init__(self, periods: tuple[int, ...]):
+        if not periods:
+            raise ValueError("List periods need the Periods column, e.g. 1;2;5;10.")
+        if any(p < 1 for p in periods):
+            raise ValueError("Periods must be positive integers.")
+        self.pool = list_pool(periods)
+
+    @classmethod
+    def parameters(cls, req) -> tuple:
+        return (tuple(req.periods) if req.periods else (),)
+
+    def generate(self, unique: bool, utilization: list[float]) -> list[int]:
+        minimums = [shortest_period(u) for u in utilization]
+        if unique:
+            return self.pool.sample_unique(len(utilization), minimums)
+        return [self.pool.sample(minimum) for minimum in minimums]
+
+class HarmonicPeriods(PeriodGenerator):
+    '''
+    Harmonic periods: a chain where every period divides the next one, so the hyperperiod is the
+    largest period. The chain starts at period_min (default: 10) and grows by a factor of 2 or 3
+    per step without exceeding period_max. Unique periods use one chain step per task; otherwise
+    tasks are spread over a chain of about half as many steps.
+    '''
+
+    DEFAULT_BASE = 10
+    FACTORS = (2, 3)
+
+    def __init__(self, period_min: int = None, period_max: int = None):
+        self.base = period_min if period_min is not None else self.DEFAULT_BASE
+        self.period_max = period_max
+        if self.base < 1 or (period_max is not None and period_max < self.base):
+            raise ValueError("Harmonic periods need 1 <= PeriodMin <= PeriodMax.")
+
+    @classmethod
+    def parameters(cls, req) -> tuple:
+        return (req.period_min, req.period_max)
+
+    def generate(self, unique: bool, utilization: list[float]) -> list[int]:
+        size = len(utilization)
+        chain = self.chain(size if unique else max(1, (size + 1) // 2))
+        if unique:
+            random.shuffle(chain)
+            return chain
+        # Every step of the chain is used at least once
+        periods = chain + [random.choice(chain) for _ in range(size - len(chain))]
+        random.shuffle(periods)
+        return periods
+
+    def chain(self, length: int) -> list[int]:
+        '''
+        Draw a chain of harmonic periods.
+
+        Parameters:
+            length (int): The number of periods.
+
+        Returns:
+            list[int]: The periods in increasing order, each dividing the next.
+        '''
+
+        smallest = min(self.FACTORS)
+        if self.period_max is not None and self.base * smallest ** (length - 1) > self.period_max:
+            raise ValueError(f"No chain of {length} harmonic periods fits between {self.base} and {self.period_max}.")
+        chain = [self.base]
+        for remaining in range(length - 2, -1, -1):
+            # Keep room for the remaining steps at the smallest factor
+            factors = [f for f in self.FACTORS
+                       if self.period_max is None or chain[-1] * f * smallest ** remaining <= self.period_max]
+            chain.append(chain[-1] * random.choice(factors))
+        return chain
+
+class PeriodPool:
+    '''
+    A weighted set of candidate periods with an alias table (Vose), so drawing a period costs O(1)
+    whatever the size of the pool. The values are sorted in ascending order.
+    '''
+
+    def __init__(self, values: list[int], weights: list[float]):
+        self.values = values
+        self.weights = weights
+        n = len(values)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.probability[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+
+    def __len__(self):
+        return len(self.values)
+
+    def sample(self, minimum: int = 0) -> int:
+        '''
+        Draw a period among the periods of at least minimum, the largest period if there is none.
+        '''
+
+        start = bisect_left(self.values, minimum)
+        if start >= len(self.values):
+            return self.values[-1]
+        # Rejecting short periods is O(1) per draw unless most of the weight is below the minimum
+        for _ in range(1 if start == 0 else 4):
+            i = random.randrange(len(self.values))
+            period = self.values[i] if random.random() < self.probability[i] else self.values[self.alias[i]]
+            if period >= minimum:
+                return period
+        return random.choices(self.values[start:], self.weights[start:])[0]
+
+    def sample_unique(self, count: int, minimums: list[int] = None) -> list[int]:
+        '''
+        Draw count distinct periods (weighted sampling without replacement).
+
+        Parameters:
+            count (int): The number of periods.
+            minimums (list[int]): The shortest acceptable period of each draw (default: none). A
+                                  draw gets the longest period left if none of its periods is left.
+
+        Returns:
+            list[int]: The periods, in the order of the minimums.
+        '''
+
+        if count > len(self.values):
+            raise ValueError(f"Cannot draw {count} unique periods from a pool of {len(self.values)}.")
+        minimums = minimums if minimums is not None else [0] * count
+        chosen = [0] * count
+        seen = set()
+        # The most constrained draws go first, so they still find a long enough period
+        for index in sorted(range(count), key=lambda i: -minimums[i]):
+            minimum = minimums[index]
+            # Rejecting repeats is O(1) per period unless the pool is nearly exhausted
+            for _ in range(4):
+                period = self.sample(minimum)
+                if period not in seen and period >= minimum:
+                    break
+            else:
+                rest = [(v, w) for v, w in zip(self.values, self.weights) if v not in seen]
+                eligible = [(v, w) for v, w in rest if v >= minimum]
+                if eligible:
+                    period = random.choices([v for v, _ in eligible], [w for _, w in eligible])[0]
+                else:
+                    period = rest[-1][0]
+            seen.add(period)
+            chosen[index] = period
+        return chosen
+
+@lru_cache(maxsize=64)
+def log_uniform_pool(period_min: int, period_max: int, granularity: int) -> PeriodPool:
+    '''
+    Build (once per set of parameters) the pool of the multiples of the granularity in
+    [period_min, period_max], weighted by the log-uniform mass of the values rounding to each.
+    '''
+
+    values = list(range(math.ceil(period_min / granularity) * granularity, period_max + 1, granularity))
+    if not values:
+        raise ValueError(f"No multiple of {granularity} between {period_min} and {period_max}.")
+    if len(values) == 1:
+        return PeriodPool(values, [1.0])
+    weights = [math.log(min(v + granularity / 2, period_max) / max(v - granularity / 2, period_min)) for v in values]
+    return PeriodPool(values, weights)
+
+@lru_cache(maxsize=64)
+def list_pool(periods: tuple[int, ...]) -> PeriodPool:
+    values = sorted(set(periods))
+    return PeriodPool(values, [1.0] * len(values))
+
+class DefaultTaskBuilder(TaskBuilder):
+    '''
+    Reference task builder: WCET is the period times the utilization (at least 1), BCET is 20% to 50%
+    of the WCET and deadlines equal periods.
+
+    WCETs are rounded with error diffusion: the utilization lost or gained by rounding one task is
+    carried over to the next, so the total utilization stays on target for any periods. Periods from
+    the reference generator make every WCET an integer, so nothing is carried for them.
+    '''
+
+    def build(self, utilization: list[float], periods: list[int]) -> TaskSet:
+        taskset = TaskSet()
+        carry = 0.0
+        for i, u in enumerate(utilization):
+            target = u + carry
+            wcet = min(periods[i], max(1, round(periods[i] * target)))
+            carry = target - wcet / periods[i]
+            taskset.add_task(self.create_task(f"Task_{i}", wcet, periods[i]))
+        return taskset
+
+    def create_task(self, name: str, wcet: int, period: int) -> Task:
+        '''
+        Create a task with a given name, WCET, period, and deadline.
+
+        Parameters:
+            name (str): The name of the task.
+            wcet (float): The worst-case execution time (WCET) of the task.
+            period (int): The period of the task.
+
+        Returns:
+            Task: The created task.
+        '''
+
+        # BCET is 20% to 50% of WCET, ensuring it is at least 0
+        bcet = round(max(0, wcet * random.uniform(0.2, 0.5)))
+        return Task(
+            name=name,
+            bcet=bcet,
+            wcet=wcet,
+            period=period,
+            deadline=period,  # Deadline equals period
+        )
+
+def shortest_period(utilization: float) -> int:
+    '''
+    The shortest period for which a task of the given utilization gets a WCET of at least 1, so
+    that its WCET does not have to be clamped up.
+
+    Parameters:
+        utilization (float): The utilization of the task.
+
+    Returns:
+        int: The smallest integer period T with T * utilization >= 1 (0 for no utilization).
+    '''
+
+    if utilization <= 0:
+        return 0
+    return math.ceil(1 / utilization - 1e-9)
+
+def find_integer_n(x: float) -> int:
+    '''
+    Given a float x, find the smallest integer n such that n * x is an integer.
+
+    Parameters:
+        x (float): The input float x.
+
+    Returns:
+        int: The smallest integer n such that n * x is an integer.
+    '''
+
+    # Validate input
+    if not isinstance(x, (float, int)):
+        raise TypeError("Input must be a float or an integer.")
+    if not (0 < x):
+        raise ValueError("Input must be a positive float.")
+    # Ensure x has at most 2 decimal places
+    x = round(x, 2)
+
+    # Convert x to a Fraction
+    try:
+        frac = Fraction(x).limit_denominator()
+    except Exception as e:
+        raise TypeError(f"Cannot convert input to a Fraction: {e}")
+
+    n = frac.denominator
+
+    # Verify that n * x is indeed an integer
+    # Due to floating-point precision, use a tolerance
+    product = n * x
+    if not product.is_integer():
+        # Alternatively, use a tolerance if necessary
+        if not abs(product - round(product)) < 1e-10:
+            raise ValueError("Unable to find an integer n such that n * x is exactly an integer.")
+
+    return n
+
+# Stage implementations selectable from the requirement columns
+UTILIZATION_SAMPLERS = {
+    'default': BaselineUtilizationSampler,
+    'uunifast': UUniFastSampler,
+}
+PERIOD_GENERATORS = {
+    'default': UtilizationDenominatorPeriods,
+    'loguniform': LogUniformPeriods,
+    'list': ListPeriods,
+    'harmonic': HarmonicPeriods,
+}
+TASK_BUILDERS = {
+    'default': DefaultTaskBuilder,
+}
+PRIORITY_ASSIGNERS = {
+    'RM': RateMonotonic,
+    'AMC': AMCPriorityAssignment,
+}
+
+_REGISTRIES = {
+    'UtilSampler': (UTILIZATION_SAMPLERS, UtilizationSampler),
+    'PeriodMode': (PERIOD_GENERATORS, PeriodGenerator),
+    'TaskBuilder': (TASK_BUILDERS, TaskBuilder),
+    'PriorityAssignment': (PRIORITY_ASSIGNERS, SchedulingAlgorithm),
+}
+
+def register_stage(column: str, name: str, stage: type) -> None:
+    '''
+    Register a stage implementation under a name, selectable from a requirement column.
+
+    Parameters:
+        column (str): The requirement column: UtilSampler, PeriodMode, TaskBuilder or PriorityAssignment.
+        name (str): The value selecting the implementation in that column.
+        stage (type): The implementation, a subclass of the stage interface of the column.
+    '''
+
+    if column not in _REGISTRIES:
+        raise ValueError(f"Unknown stage column: {column}. Options: {', '.join(_REGISTRIES)}")
+    registry, interface = _REGISTRIES[column]
+    if not (isinstance(stage, type) and issubclass(stage, interface)):
+        raise TypeError(f"{column} stages must subclass {interface.__name__}.")
+    registry[name] = stage
+
+def stage_options(column: str) -> str:
+    '''
+    Describe the registered implementations of a requirement column, for error messages.
+    '''
+
+    registry, _ = _REGISTRIES[column]
+    return "\n\tOptions:\n" + "\n".join(f"\t\t- {name}" for name in registry)
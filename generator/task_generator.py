@@ -1,20 +1,36 @@
-import random
 from .task_requirements import TaskRequirements, Requirement
-from model import Task, TaskSet
+from .fingerprint_index import FingerprintIndex
+from .profiling import GenerationProfile
+from .stages import (
+    BaselineUtilizationSampler, UtilizationDenominatorPeriods, DefaultTaskBuilder, find_integer_n, stage_options,
+    UTILIZATION_SAMPLERS, PERIOD_GENERATORS, TASK_BUILDERS,
+)
+from model import Task, TaskSet, TaskType, Criticality
 from scheduling import SchedulingAlgorithm
+from contextlib import nullcontext
 import itertools
+import os
+import random
 import sys
 import threading
 import time
-from fractions import Fraction
 
 class TaskGenerator:
     MAX_UTILIZATION = 1.0
     MIN_UTILIZATION = 0.01
+    MAX_DUPLICATE_ATTEMPTS = 1000
+    FINGERPRINT_FILE = ".fingerprints"
 
-    def __init__(self, test_requirements: TaskRequirements, output_dir: str):
+    def __init__(self, test_requirements: TaskRequirements, output_dir: str, unique_sets: bool = False, profile_top: int = None):
         self.test_requirements = test_requirements
         self.output_dir = output_dir
+        # Number of hot functions reported per requirement when profiling, None to disable profiling
+        self.profile_top = profile_top
+        self.__stages = {}
+        # Index of already generated tasksets, shared across runs through the output directory
+        self.fingerprints = None
+        if unique_sets:
+            self.fingerprints = FingerprintIndex(os.path.join(output_dir, self.FINGERPRINT_FILE))
 
     def generate_taskset(self, req: Requirement) -> TaskSet:
         '''
@@ -27,36 +43,71 @@ class TaskGenerator:
             TaskSet: The generated taskset.
         '''
         
-        # Verify input requirement before generating taskset
+        return self.generate_batch(req, 1)[0]
+
+    def generate_batch(self, req: Requirement, count: int) -> list[TaskSet]:
+        '''
+        Generate several tasksets for the same requirements, running each generation stage
+        on the whole batch at once.
+
+        Parameters:
+            req (Requirement): The requirements for the tasksets.
+            count (int): The number of tasksets to generate.
+
+        Returns:
+            list[TaskSet]: The generated tasksets.
+        '''
+
+        # Verify input requirement before generating tasksets
         self.__verify_requirement(req)
-        
-        done = False
+        sampler = self.__stage(UTILIZATION_SAMPLERS, req.util_sampler, req)
+        period_generator = self.__stage(PERIOD_GENERATORS, 'harmonic' if req.harmonic else req.period_mode, req)
+        task_builder = self.__stage(TASK_BUILDERS, req.task_builder, req)
+
+        accepted = []
         threshold = 0
+        duplicates = 0
+
+        while len(accepted) < count:
+            missing = count - len(accepted)
 
-        while not done:
-            
             # Generate random utilization values for each task
-            utilization = self.__generate_utilization(req.size, req.utilization, self.MAX_UTILIZATION)
+            utilizations = sampler.sample_batch(missing, req.size, req.utilization, self.MAX_UTILIZATION)
 
             # Generate the periods divisible by the utilizations for simpler WCET
-            periods = self.__generate_periods(req.unique_periods, utilization, req.algorithm)
+            periods = period_generator.generate_batch(req.unique_periods, utilizations)
 
-            # Built the taskset based on the generated utilization and periods
-            taskset = self.__create_taskset(utilization, periods)
+            # Built the tasksets based on the generated utilization and periods
+            tasksets = task_builder.build_batch(utilizations, periods)
 
-            # Check if the taskset meets the requirements and respects deviation threshold
-            util_deviation = abs(taskset.worst_case_utilization - req.utilization)
-            if len(taskset) == req.size and util_deviation <= threshold:
-                done = True
-            else:
+            rejected = False
+            for taskset in tasksets:
+                # Check if the taskset meets the requirements and respects deviation threshold
+                util_deviation = abs(taskset.worst_case_utilization - req.utilization)
+                if len(taskset) != req.size or util_deviation > threshold:
+                    rejected = True
+                    continue
+
+                self.__assign_task_types(taskset, req.et_fraction)
+                self.__assign_criticality(taskset, req.hi_fraction, req.criticality_factor)
+
+                # Reject tasksets identical (up to naming and order) to previously generated ones
+                if self.fingerprints is not None and not self.fingerprints.add(taskset.fingerprint()):
+                    duplicates += 1
+                    if duplicates >= self.MAX_DUPLICATE_ATTEMPTS:
+                        raise ValueError(f"Could not generate a taskset that differs from the {len(self.fingerprints)} already generated ones.")
+                    continue
+
+                accepted.append(taskset)
+
+            if rejected:
                 threshold += 0.01
-                continue
 
         # Assign priorities to the tasks if an algorithm is provided
         if req.algorithm != None:
-            req.algorithm.assign_priorities(taskset)
+            req.algorithm.assign_priorities_batch(accepted)
 
-        return taskset
+        return accepted
    
     def generate_tasksets(self) -> None:
         ''' 
@@ -64,109 +115,88 @@ class TaskGenerator:
         '''
 
         for req in self.test_requirements:
+            file_path = f"{self.output_dir}/{req.utilization}_utilization/"
+            message = f'Generating taskset for test requirements: \033[92m{req.name}\033[0m'
             print() # Loading animation
-            loading_thread, stop_loading = self.__animate_loading(f'Generating taskset for test requirements: \033[92m{req.name}\033[0m')
+            if self.profile_top is None:
+                profile = nullcontext()
+                loading_thread, stop_loading = self.__animate_loading(message)
+            else:
+                # No loading animation while profiling, so its thread stays out of the profile
+                profile = GenerationProfile(self.profile_top)
+                print(message, end='')
+                loading_thread, stop_loading = None, lambda: None
 
+            # Stop the loading animation however the requirement ends, or its thread keeps the process alive
             try:
-                taskset = self.generate_taskset(req)
-            except Exception as e:
-                print(f"\n\033[91mError: {e}\033[0m")
+                try:
+                    with profile:
+                        taskset = self.generate_taskset(req)
+                except Exception as e:
+                    print(f"\n\033[91mError: {e}\033[0m")
+                    continue
+
+                self.__pretty_print_results(req, taskset, file_path)
+
+                taskset.to_csv(
+                    file_path,
+                    f"{req.name}_taskset"
+                )
+            finally:
                 stop_loading()
-                loading_thread.join()
-                continue
-
-            file_path = f"{self.output_dir}/{req.utilization}_utilization/"
-
-            self.__pretty_print_results(req, taskset, file_path)
-
-            taskset.to_csv(
-                file_path,
-                f"{req.name}_taskset"
-            )
-
-            stop_loading()
-            loading_thread.join()
+                if loading_thread is not None:
+                    loading_thread.join()
+                self.__save_profile(profile, file_path, req)
         
         print("\n\033[92mDone!\033[0m")
 
+    def __save_profile(self, profile, file_path: str, req: Requirement) -> None:
+        if isinstance(profile, GenerationProfile):
+            _, summary_path = profile.save(file_path, f"{req.name}_taskset")
+            print(f"Profile ({profile.elapsed:.3f} s, peak {profile.peak_memory / 1024:.1f} KiB) stored in: \033[92m{summary_path}\033[0m")
+
     def __generate_utilization(self, numTasks: int, utilization: float, taskUtilizationLimit: float) -> list[float]:
         '''
-        Generate utilization values for the tasks based on the given requirements.
-
-        Parameters:
-            numTasks (int): The number of tasks.
-            utilization (float): The total utilization of the tasks.
-            taskUtilizationLimit (float): The maximum utilization of a task.
-
-        Returns:
-            list[float]: The generated utilization values for the tasks.
+        Generate utilization values for the tasks with the reference sampler (see stages.BaselineUtilizationSampler).
         '''
         
-        # Ensure the requested total utilization is enough to give each task at least 1% utilization
-        if utilization < numTasks * self.MIN_UTILIZATION:
-            raise ValueError("Number of tasks and total utilization must be such that each task can have at least 1% utilization.")
-
-        # The baseline is allocated to each task
-        baseline = [self.MIN_UTILIZATION] * numTasks
-        remainder = utilization - (self.MIN_UTILIZATION * numTasks)
-
-        while True:
-            # Generate a random partition of the remaining utilization over the tasks
-            random_parts = [random.random() for _ in range(numTasks)]
-            sum_random = sum(random_parts)
-            # Calculate additional utilization for each task based on the random weights
-            additions = [(part / sum_random) * remainder for part in random_parts]
-
-            # Sum baseline and addition, rounded to 2 decimals
-            utilizationValues = [round(base + add, 2) for base, add in zip(baseline, additions)]
-            # Adjust the last task to ensure the total sums exactly to the requested utilization
-            diff = round(utilization - sum(utilizationValues), 2)
-            utilizationValues[-1] = round(utilizationValues[-1] + diff, 2)
-
-            # Ensure the last task still meets the minimum utilization
-            if utilizationValues[-1] < self.MIN_UTILIZATION:
-                continue
-
-            # Check that no task exceeds the provided taskUtilizationLimit
-            if all(u <= taskUtilizationLimit for u in utilizationValues):
-                break
-
-        return utilizationValues
+        return BaselineUtilizationSampler(self.MIN_UTILIZATION).sample(numTasks, utilization, taskUtilizationLimit)
     
     def __generate_periods(self, unique: bool, utilization: list[float], algorithm: SchedulingAlgorithm) -> list[int]:
         '''
-        Generate periods for the tasks based on the given utilization values and requirements.
+        Generate periods for the tasks with the reference generator (see stages.UtilizationDenominatorPeriods).
+        '''
 
-        Parameters:
-            unique (bool): Whether the periods should be unique.
-            utilization (list[float]): The utilization values for the tasks.
-            algorithm (SchedulingAlgorithm): The priority assignment algorithm.
+        return UtilizationDenominatorPeriods().generate(unique, utilization)
 
-        Returns:
-            list[int]: The generated periods for the tasks.
+    def __assign_task_types(self, taskset: TaskSet, et_fraction: float) -> None:
+        '''
+        Turn a random fraction of the tasks into event-triggered tasks, whose MIT is their period.
         '''
 
+        tasks = list(taskset)
+        for task in random.sample(tasks, round(et_fraction * len(tasks))):
+            task.task_type = TaskType.ET
+            task.MIT = task.period
 
-        def scale_up_duplicates(periods: list[int]) -> None:
-            '''
-            Scale up the periods of tasks that have the same period to make them unique.
-            '''
-            duplicates = {}
-            for idx, p in enumerate(periods):
-                duplicates.setdefault(p, []).append(idx)
-            for p, indices in duplicates.items():
-                if len(indices) > 1:
-                    for i in indices[1:]:
-                        scale_factor = random.randint(2, 3)
-                        periods[i] = periods[i] * scale_factor
+    def __assign_criticality(self, taskset: TaskSet, hi_fraction: float, factor: float) -> None:
+        '''
+        Turn a random fraction of the tasks into HI criticality tasks, whose HI criticality WCET
+        is their WCET times the criticality factor.
+        '''
 
-        periods = [ self.__find_integer_n(u) for u in utilization ]
-        # Ensure periods are unique if requested
-        if unique:
-            while len(set(periods)) != len(periods):
-                scale_up_duplicates(periods)
+        tasks = list(taskset)
+        for task in random.sample(tasks, round(hi_fraction * len(tasks))):
+            task.criticality = Criticality.HI
+            task.wcet_hi = max(task.wcet, round(task.wcet * factor))
 
-        return periods
+    def __stage(self, registry: dict, name: str, req: Requirement):
+        # Stage instances are stateless, so one instance per implementation and parameters is reused
+        stage = registry[name]
+        key = (id(registry), name, stage.parameters(req))
+        if key not in self.__stages:
+            self.__stages[key] = stage.from_requirement(req)
+        return self.__stages[key]
 
     def __animate_loading(self, text):
         done_event = threading.Event()
@@ -183,10 +213,36 @@ class TaskGenerator:
         t.start()
         return t, done_event.set
     
-    def __pretty_print_results(self, req: Requirement, taskset: TaskSet, file_path: str) -> None:
+    @staticmethod
+    def check_taskset(taskset: TaskSet, requested_utilization: float = None) -> dict:
+        '''
+        Compute the properties of a generated taskset that are checked against its requirement.
+
+        Parameters:
+            taskset (TaskSet): The generated taskset.
+            requested_utilization (float): The requested utilization, if known (default: None).
+
+        Returns:
+            dict: The actual utilization, the deviation from the requested utilization (None if
+                  unknown), the hyperperiod and whether all periods are unique.
+        '''
+
         actual_utilization = sum(task.wcet / task.period for task in taskset)
-        utilization_deviation = round(abs(actual_utilization - req.utilization), 2)
+        utilization_deviation = None
+        if requested_utilization is not None:
+            utilization_deviation = round(abs(actual_utilization - requested_utilization), 2)
         periods = [task.period for task in taskset]
+        return {
+            'utilization': actual_utilization,
+            'utilization_deviation': utilization_deviation,
+            'hyperperiod': int(taskset.hyperperiod),
+            'unique_periods': len(periods) == len(set(periods)),
+        }
+
+    def __pretty_print_results(self, req: Requirement, taskset: TaskSet, file_path: str) -> None:
+        checks = self.check_taskset(taskset, req.utilization)
+        actual_utilization = checks['utilization']
+        utilization_deviation = checks['utilization_deviation']
 
         print(f"\n{'='*40}")
         print(f"Number of tasks: {req.size}")
@@ -194,21 +250,21 @@ class TaskGenerator:
         if utilization_deviation > 0:
             deviation_str = f"\033[93m{deviation_str}\033[0m"
         print(f"Utilization (requested/taskset/deviation): {req.utilization:.2f}/{actual_utilization:.2f}/{deviation_str}")
-        print(f"Hyperperiod: {int(taskset.hyperperiod)}")
-        unique_status = len(periods) == len(set(periods))
+        print(f"Hyperperiod: {checks['hyperperiod']}")
+        unique_status = checks['unique_periods']
         if unique_status != req.unique_periods:
             print(f"Unique periods: \033[93m{unique_status}\033[0m")
         else:
             print(f"Unique periods: {unique_status}")
         
         # Check if periods are actually unique
-        if req.unique_periods and len(periods) != len(set(periods)):
+        if req.unique_periods and not unique_status:
             print(f"\033[93mWarning: Requested unique periods not possible for this request!\033[0m")
         print(f"{'='*40}\n")
         print(f"Taskset stored in: \033[92m{file_path}{req.name}_taskset.csv\033[0m")
 
     def __verify_requirement(self, req: Requirement) -> None:
-        algorithm_options = "\n\tOptions:\n\t\t- RM: Rate Monotonic"
+        algorithm_options = stage_options('PriorityAssignment')
         
         # Name
         if not isinstance(req.name, str):
@@ -231,83 +287,41 @@ class TaskGenerator:
             raise ValueError("Priority Assignment Algorithm must be provided." + algorithm_options)
         if req.algorithm is not None and not isinstance(req.algorithm, SchedulingAlgorithm):
             raise ValueError("Priority Assignment Algorithm must be a valid SchedulingAlgorithm." + algorithm_options)
+        # Generation stages
+        if req.util_sampler not in UTILIZATION_SAMPLERS:
+            raise ValueError(f"Unknown utilization sampler: {req.util_sampler}." + stage_options('UtilSampler'))
+        if req.period_mode not in PERIOD_GENERATORS:
+            raise ValueError(f"Unknown period mode: {req.period_mode}." + stage_options('PeriodMode'))
+        if req.task_builder not in TASK_BUILDERS:
+            raise ValueError(f"Unknown task builder: {req.task_builder}." + stage_options('TaskBuilder'))
+        if not isinstance(req.harmonic, bool):
+            raise ValueError("Harmonic must be a boolean.")
+        # Event-triggered tasks
+        if not 0 <= req.et_fraction <= 1:
+            raise ValueError("Event-triggered fraction must be between 0 and 1.")
+        # Mixed criticality
+        if not 0 <= req.hi_fraction <= 1:
+            raise ValueError("HI criticality fraction must be between 0 and 1.")
+        if req.criticality_factor < 1:
+            raise ValueError("Criticality factor must be at least 1.")
         
     def __create_task(self, name: str, wcet: int, period: int) -> Task:
         '''
-        Create a task with a given name, WCET, period, and deadline.
-
-        Parameters:
-            name (str): The name of the task.
-            wcet (float): The worst-case execution time (WCET) of the task.
-            period (int): The period of the task.
-
-        Returns:
-            Task: The created task.
+        Create a task with the reference task builder (see stages.DefaultTaskBuilder).
         '''
 
-        # BCET is 20% to 50% of WCET, ensuring it is at least 0
-        bcet = round(max(0, wcet * random.uniform(0.2, 0.5)))
-        return Task(
-            name=name,
-            bcet=bcet,
-            wcet=wcet,
-            period=period,
-            deadline=period,  # Deadline equals period
-        )
+        return DefaultTaskBuilder().create_task(name, wcet, period)
     
     def __create_taskset(self, utilization: list[float], periods: list[int]) -> TaskSet:
         '''
-        Create a taskset based on the given utilization values and periods.
-
-        Parameters:
-            utilization (list[float]): The utilization values for the tasks.
-            periods (list[int]): The periods for the tasks.
-
-        Returns:
-            TaskSet: The created taskset.
+        Create a taskset with the reference task builder (see stages.DefaultTaskBuilder).
         '''
         
-        taskset = TaskSet()
-        for i, u in enumerate(utilization):
-            wcet = max(1, round(periods[i] * u))
-            task = self.__create_task(f"Task_{i}", wcet, periods[i])
-            taskset.add_task(task)
-        
-        return taskset
+        return DefaultTaskBuilder().build(utilization, periods)
 
     def __find_integer_n(self, x: float) -> int:
         '''
-        Given a float x, find the smallest integer n such that n * x is an integer.
-
-        Parameters:
-            x (float): The input float x.
-
-        Returns:
-            int: The smallest integer n such that n * x is an integer.
+        Given a float x, find the smallest integer n such that n * x is an integer (see stages.find_integer_n).
         '''
         
-        # Validate input
-        if not isinstance(x, (float, int)):
-            raise TypeError("Input must be a float or an integer.")
-        if not (0 < x):
-            raise ValueError("Input must be a positive float.")
-        # Ensure x has at most 2 decimal places
-        x = round(x, 2)
-
-        # Convert x to a Fraction
-        try:
-            frac = Fraction(x).limit_denominator()
-        except Exception as e:
-            raise TypeError(f"Cannot convert input to a Fraction: {e}")
-
-        n = frac.denominator
-        
-        # Verify that n * x is indeed an integer
-        # Due to floating-point precision, use a tolerance
-        product = n * x
-        if not product.is_integer():
-            # Alternatively, use a tolerance if necessary
-            if not abs(product - round(product)) < 1e-10:
-                raise ValueError("Unable to find an integer n such that n * x is exactly an integer.")
-
-        return n
\ No newline at end of file
+        return find_integer_n(x)
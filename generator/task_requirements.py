@@ -1,5 +1,6 @@
 import csv
-from scheduling import SchedulingAlgorithm, RateMonotonic
+from scheduling import SchedulingAlgorithm
+from .stages import PRIORITY_ASSIGNERS
 
 class Requirement:
     '''
@@ -17,24 +18,120 @@ class Requirement:
         Whether the taskset has unique periods or not.
     algorithm : SchedulingAlgorithm
         The scheduling algorithm used to assign priorities.
+    util_sampler : str
+        The registered utilization sampler (default: "default").
+    period_mode : str
+        The registered period generator (default: "default").
+    task_builder : str
+        The registered WCET/BCET task builder (default: "default").
+    et_fraction : float
+        The fraction of event-triggered tasks, whose MIT is their period (default: 0.0).
+    period_min : int
+        The smallest period of the "loguniform" period mode (default: None).
+    period_max : int
+        The largest period of the "loguniform" period mode (default: None).
+    period_granularity : int
+        The periods of the "loguniform" period mode are multiples of it (default: 1).
+    periods : list[int]
+        The candidate periods of the "list" period mode (default: None).
+    harmonic : bool
+        Whether to generate harmonic periods, overriding the period mode (default: False).
+    hi_fraction : float
+        The fraction of HI criticality tasks (default: 0.0).
+    criticality_factor : float
+        The ratio of the HI criticality WCET to the WCET of HI criticality tasks (default: 2.0).
     '''
 
     def __init__(self, 
                  name: str, size: int, 
                  utilization: float, 
                  unique_periods: bool,
-                 algorithm: SchedulingAlgorithm
+                 algorithm: SchedulingAlgorithm,
+                 util_sampler: str = 'default',
+                 period_mode: str = 'default',
+                 task_builder: str = 'default',
+                 et_fraction: float = 0.0,
+                 period_min: int = None,
+                 period_max: int = None,
+                 period_granularity: int = 1,
+                 periods: list[int] = None,
+                 harmonic: bool = False,
+                 hi_fraction: float = 0.0,
+                 criticality_factor: float = 2.0
     ):
         self.name = name
         self.size = size
         self.utilization = utilization
         self.unique_periods = unique_periods
         self.algorithm = algorithm
+        self.util_sampler = util_sampler
+        self.period_mode = period_mode
+        self.task_builder = task_builder
+        self.et_fraction = et_fraction
+        self.period_min = period_min
+        self.period_max = period_max
+        self.period_granularity = period_granularity
+        self.periods = periods
+        self.harmonic = harmonic
+        self.hi_fraction = hi_fraction
+        self.criticality_factor = criticality_factor
+
+    @classmethod
+    def from_row(cls, row: dict) -> 'Requirement':
+        '''
+        Create a requirement from a row keyed by the configuration file columns.
+
+        Parameters:
+            row (dict): The column values, e.g. a row of the configuration CSV or a JSON object.
+
+        Returns:
+            Requirement: The requirement described by the row.
+        '''
+        algorithm = None
+        algorithm_class = PRIORITY_ASSIGNERS.get(str(row['PriorityAssignment']).strip())
+        if algorithm_class is not None:
+            algorithm = algorithm_class()
+
+        # Create a dictionary with mandatory arguments
+        req_args = {
+            'name': row['Name'],
+            'size': int(str(row['Size']).strip()),
+            'utilization': float(str(row['Utilization']).strip()),
+            'unique_periods': str(row['UniquePeriods']).strip().lower() == 'true',
+            'algorithm': algorithm,
+        }
+        # Optional stage selection columns
+        for column, arg in (('UtilSampler', 'util_sampler'), ('PeriodMode', 'period_mode'), ('TaskBuilder', 'task_builder')):
+            if row.get(column) not in (None, ''):
+                req_args[arg] = str(row[column]).strip()
+        if row.get('EventTriggered') not in (None, ''):
+            req_args['et_fraction'] = float(str(row['EventTriggered']).strip())
+        # Optional period distribution parameters
+        for column, arg in (('PeriodMin', 'period_min'), ('PeriodMax', 'period_max'), ('PeriodGranularity', 'period_granularity')):
+            if row.get(column) not in (None, ''):
+                req_args[arg] = int(str(row[column]).strip())
+        if row.get('Periods') not in (None, ''):
+            periods = row['Periods']
+            if isinstance(periods, str):
+                periods = [p for p in periods.split(';') if p.strip()]
+            req_args['periods'] = [int(str(p).strip()) for p in periods]
+        if row.get('Harmonic') not in (None, ''):
+            req_args['harmonic'] = str(row['Harmonic']).strip().lower() == 'true'
+        # Optional dual-criticality parameters
+        for column, arg in (('HiFraction', 'hi_fraction'), ('CriticalityFactor', 'criticality_factor')):
+            if row.get(column) not in (None, ''):
+                req_args[arg] = float(str(row[column]).strip())
+        return cls(**req_args)
 
     def __repr__(self):
         return (f"Requirement(name={self.name}, size={self.size}, utilization={self.utilization}, "
                 f"unique_periods={self.unique_periods},"
-                f"algorithm={self.algorithm})")
+                f"algorithm={self.algorithm}, util_sampler={self.util_sampler}, "
+                f"period_mode={self.period_mode}, task_builder={self.task_builder}, "
+                f"et_fraction={self.et_fraction}, period_min={self.period_min}, period_max={self.period_max}, "
+                f"period_granularity={self.period_granularity}, periods={self.periods}, "
+                f"harmonic={self.harmonic}, hi_fraction={self.hi_fraction}, "
+                f"criticality_factor={self.criticality_factor})")
 
 class TaskRequirements:
     '''
@@ -57,21 +154,7 @@ class TaskRequirements:
         with open(file_path, mode='r') as file:
             csv_reader = csv.DictReader(file)
             for row in csv_reader:
-                algorithm = None
-                if row['PriorityAssignment'].strip() == 'RM':
-                    algorithm = RateMonotonic()
-
-                # Create a dictionary with mandatory arguments
-                req_args = {
-                    'name': row['Name'],
-                    'size': int(row['Size'].strip()),
-                    'utilization': float(row['Utilization'].strip()),
-                    'unique_periods': row['UniquePeriods'].strip().lower() == 'true',
-                    'algorithm': algorithm,
-                }
-                
-                requirement = Requirement(**req_args)
-                requirements.append(requirement)
+                requirements.append(Requirement.from_row(row))
         return cls(requirements)
 
     def __repr__(self):
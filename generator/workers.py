@@ -0,0 +1,15 @@
+import random
+from typing import Optional
+
+def seed_worker(seed: Optional[int] = None) -> None:
+    '''
+    Seed the random state of a worker process.
+
+    Forked workers inherit the random state of their parent, so without reseeding every worker
+    would generate the same tasksets. Call this at the start of the work a worker does.
+
+    Parameters:
+        seed (int): The seed, for reproducible workers (default: fresh OS entropy).
+    '''
+
+    random.seed(seed)
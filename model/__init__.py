@@ -1,2 +1,3 @@
-from .task import Task
-from .taskset import TaskSet
\ No newline at end of file
+from .task import Task, TaskType, Criticality
+from .taskset import TaskSet
+from .mutation import Mutation, SetWcet, SetPeriod, SwapPeriods, AddTask, RemoveTask
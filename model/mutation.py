@@ -0,0 +1,127 @@
+from abc import ABC, abstractmethod
+import copy
+from typing import Any, Optional
+from .task import Task
+
+class Mutation(ABC):
+    '''
+    A small change to a TaskSet, applied with TaskSet.apply.
+
+    Applying a mutation returns its inverse, so TaskSet.undo can revert it.
+    '''
+
+    @abstractmethod
+    def apply(self, taskset: Any, algorithm: Any = None) -> 'Mutation':
+        '''
+        Apply the mutation to a task set.
+
+        Args:
+            taskset (TaskSet): The task set to modify.
+            algorithm (SchedulingAlgorithm): Update priorities incrementally with this algorithm (default: None).
+
+        Returns:
+            Mutation: The mutation that reverts this one.
+        '''
+        pass
+
+class SetWcet(Mutation):
+    '''
+    Change the WCET (and optionally the BCET and the HI criticality WCET) of a task.
+    '''
+
+    def __init__(self, name: str, wcet: int, bcet: Optional[int] = None, wcet_hi: Optional[int] = None) -> None:
+        self.name = name
+        self.wcet = wcet
+        self.bcet = bcet
+        self.wcet_hi = wcet_hi
+
+    def apply(self, taskset: Any, algorithm: Any = None) -> Mutation:
+        task = taskset.tasks[self.name]
+        inverse = SetWcet(self.name, task.wcet, task.bcet, task.wcet_hi)
+        bcet = self.bcet if self.bcet is not None else min(task.bcet, self.wcet)
+        taskset.set_wcet(self.name, self.wcet, bcet, self.wcet_hi)
+        return inverse
+
+    def __repr__(self):
+        return f"SetWcet(name={self.name}, wcet={self.wcet}, bcet={self.bcet}, wcet_hi={self.wcet_hi})"
+
+class SetPeriod(Mutation):
+    '''
+    Change the period (and optionally the deadline) of a task.
+    '''
+
+    def __init__(self, name: str, period: int, deadline: Optional[int] = None) -> None:
+        self.name = name
+        self.period = period
+        self.deadline = deadline
+
+    def apply(self, taskset: Any, algorithm: Any = None) -> Mutation:
+        task = taskset.tasks[self.name]
+        inverse = SetPeriod(self.name, task.period, task.deadline)
+        taskset.set_period(self.name, self.period, self.deadline, algorithm)
+        return inverse
+
+    def __repr__(self):
+        return f"SetPeriod(name={self.name}, period={self.period}, deadline={self.deadline})"
+
+class SwapPeriods(Mutation):
+    '''
+    Swap the periods of two tasks. Implicit deadlines follow the periods.
+    '''
+
+    def __init__(self, first: str, second: str) -> None:
+        self.first = first
+        self.second = second
+
+    def apply(self, taskset: Any, algorithm: Any = None) -> Mutation:
+        first, second = taskset.tasks[self.first], taskset.tasks[self.second]
+        inverse = _Sequence([
+            SetPeriod(self.second, second.period, second.deadline),
+            SetPeriod(self.first, first.period, first.deadline),
+        ])
+        first_period, second_period = first.period, second.period
+        taskset.set_period(self.first, second_period, algorithm=algorithm)
+        taskset.set_period(self.second, first_period, algorithm=algorithm)
+        return inverse
+
+    def __repr__(self):
+        return f"SwapPeriods(first={self.first}, second={self.second})"
+
+class AddTask(Mutation):
+    '''
+    Add a task to the task set.
+    '''
+
+    def __init__(self, task: Task) -> None:
+        self.task = task
+
+    def apply(self, taskset: Any, algorithm: Any = None) -> Mutation:
+        if self.task.name in taskset.tasks:
+            raise ValueError(f"Task {self.task.name} already exists.")
+        taskset.add_task(copy.copy(self.task), algorithm)
+        return RemoveTask(self.task.name)
+
+    def __repr__(self):
+        return f"AddTask(task={self.task.name})"
+
+class RemoveTask(Mutation):
+    '''
+    Remove a task from the task set. Undoing it appends the task again at the end of the set.
+    '''
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def apply(self, taskset: Any, algorithm: Any = None) -> Mutation:
+        return AddTask(taskset.remove_task(self.name, algorithm))
+
+    def __repr__(self):
+        return f"RemoveTask(name={self.name})"
+
+class _Sequence(Mutation):
+    def __init__(self, mutations: list[Mutation]) -> None:
+        self.mutations = mutations
+
+    def apply(self, taskset: Any, algorithm: Any = None) -> Mutation:
+        inverses = [mutation.apply(taskset, algorithm) for mutation in self.mutations]
+        return _Sequence(inverses[::-1])
@@ -1,6 +1,20 @@
 from enum import Enum
 from typing import Any, Optional
 
+class TaskType(Enum):
+    '''
+    Task activation type: time-triggered (periodic) or event-triggered (sporadic).
+    '''
+    TT = "TT"
+    ET = "ET"
+
+class Criticality(Enum):
+    '''
+    Criticality level of a task in a dual-criticality system.
+    '''
+    LO = "LO"
+    HI = "HI"
+
 class Task:
     '''
     Represents a task in a real-time system.
@@ -16,6 +30,8 @@ class Task:
         task_type (TaskType): Task type, either TaskType.TT or TaskType.ET (default: TaskType.TT)
         MIT (float): Minimum Inter-arrival Time for sporadic tasks (default: 0.0)
         assigned_server: Assigned server when using polling servers (default: None)
+        criticality (Criticality): Criticality level, either Criticality.LO or Criticality.HI (default: Criticality.LO)
+        wcet_hi (float): Worst-case execution time at HI criticality, the WCET for LO tasks (default: the WCET)
     '''
 
     def __init__(self, 
@@ -24,7 +40,13 @@ class Task:
                  wcet: int,  
                  period: int,
                  deadline: int,
-                 priority: int = 0) -> None:
+                 priority: int = 0,
+                 core: int = 0,
+                 task_type: TaskType = TaskType.TT,
+                 MIT: int = 0,
+                 assigned_server: Optional[Any] = None,
+                 criticality: Criticality = Criticality.LO,
+                 wcet_hi: Optional[int] = None) -> None:
         """
         Initialize a Task object with several properties.
         
@@ -35,13 +57,27 @@ class Task:
             period (int): Task period
             deadline (int): Task relative deadline
             priority (int): Task priority (default: 0.0)
+            core (int): Core number on which the task is assigned (default: 0)
+            task_type (TaskType): Task type, either TaskType.TT or TaskType.ET (default: TaskType.TT)
+            MIT (int): Minimum Inter-arrival Time for sporadic tasks (default: 0)
+            assigned_server: Assigned server when using polling servers (default: None)
+            criticality (Criticality): Criticality level, Criticality.LO or Criticality.HI (default: Criticality.LO)
+            wcet_hi (int): Worst-case execution time at HI criticality (default: the WCET)
         """
         if bcet > wcet:
             raise ValueError("BCET cannot be greater than WCET")
+        if wcet_hi is not None and wcet_hi < wcet:
+            raise ValueError("HI criticality WCET cannot be smaller than WCET")
         
         self.name = name
         self.bcet = bcet
         self.wcet = wcet
         self.period = period
         self.deadline = deadline
-        self.priority = priority
\ No newline at end of file
+        self.priority = priority
+        self.core = core
+        self.task_type = task_type
+        self.MIT = MIT
+        self.assigned_server = assigned_server
+        self.criticality = criticality
+        self.wcet_hi = wcet if wcet_hi is None else wcet_hi
@@ -1,9 +1,12 @@
-from typing import Dict
+from typing import Any, Dict, Iterator, Optional, Tuple
 from math import lcm
 from functools import reduce
+from fractions import Fraction
 import csv
 import copy
-from .task import Task
+import heapq
+import hashlib
+from .task import Task, TaskType, Criticality
 import os
 
 class TaskSet:
@@ -16,26 +19,226 @@ class TaskSet:
         worst_case_utilization (float): The worst-case CPU utilization of the task set.
     '''
 
+    CSV_HEADERS = ['Task', 'BCET', 'WCET', 'Period', 'Deadline', 'Priority', 'Type', 'MIT', 'Server', 'Criticality', 'WCET_HI']
+
     def __init__(self, tasks: list[Task] = []) -> None:
         self.tasks: Dict[str, Task] = {task.name: copy.deepcopy(task) for task in tasks}
-        self.hyperperiod: float = self.__calculate_hyperperiod()
-        self.worst_case_utilization = self.__calculate_utilization()
+        # Tasks this set may modify in place; tasks shared with a fork are copied on write
+        self._owned: set[str] = set(self.tasks)
+        self._undo_log: list = []
+        self.update_properties()
 
     def update_properties(self):
-        self.hyperperiod = self.__calculate_hyperperiod()
+        '''
+        Recompute the hyperperiod and utilization from scratch.
+
+        Needed only after modifying the tasks dictionary or Task objects directly; the
+        methods of this class keep both properties up to date incrementally.
+        '''
+        self._period_counts: Dict[int, int] = {}
+        for task in self.tasks.values():
+            period = int(task.period)
+            self._period_counts[period] = self._period_counts.get(period, 0) + 1
+        # Kept as an exact fraction so incremental updates cannot drift from a fresh sum
+        self._utilization_sum = sum((Fraction(task.wcet) / Fraction(task.period) for task in self.tasks.values() if task.period > 0), Fraction(0))
+        self.hyperperiod: float = self.__calculate_hyperperiod()
         self.worst_case_utilization = self.__calculate_utilization()
 
-    def add_task(self, task: Task) -> None:
+    def add_task(self, task: Task, algorithm: Any = None) -> None:
         '''
         Add a task to the task set.
         
         Args:
             task (Task): The task to add to the task set.
+            algorithm (SchedulingAlgorithm): Update priorities incrementally with this algorithm (default: None).
         '''
 
+        if task.name in self.tasks:
+            self.remove_task(task.name, algorithm)
         self.tasks[task.name] = task
-        self.update_properties()
+        self._owned.add(task.name)
+        self.__add_period(int(task.period))
+        self.__add_utilization(task.wcet, task.period)
+        if algorithm is not None:
+            algorithm.update_priorities(self, task.name, None, task.period)
+
+    def remove_task(self, name: str, algorithm: Any = None) -> Task:
+        '''
+        Remove a task from the task set.
+
+        Args:
+            name (str): The name of the task to remove.
+            algorithm (SchedulingAlgorithm): Update priorities incrementally with this algorithm (default: None).
+
+        Returns:
+            Task: The removed task.
+        '''
+
+        task = self.tasks.pop(name)
+        if name not in self._owned:
+            task = copy.copy(task)  # Still shared with a fork
+        self._owned.discard(name)
+        self.__remove_period(int(task.period))
+        self.__add_utilization(-task.wcet, task.period)
+        if algorithm is not None:
+            algorithm.update_priorities(self, name, task.period, None)
+        return task
+
+    def set_wcet(self, name: str, wcet: int, bcet: Optional[int] = None, wcet_hi: Optional[int] = None) -> None:
+        '''
+        Change the WCET (and optionally the BCET and the HI criticality WCET) of a task.
+
+        The HI criticality WCET of a LO criticality task follows its WCET; that of a HI criticality
+        task is kept unless given, and raised to the WCET if it would fall below it.
+
+        Args:
+            name (str): The name of the task.
+            wcet (int): The new worst-case execution time.
+            bcet (int): The new best-case execution time (default: unchanged).
+            wcet_hi (int): The new HI criticality worst-case execution time (default: see above).
+        '''
+
+        task = self.tasks[name]
+        bcet = task.bcet if bcet is None else bcet
+        if bcet > wcet:
+            raise ValueError("BCET cannot be greater than WCET")
+        if wcet_hi is None:
+            wcet_hi = max(task.wcet_hi, wcet) if task.criticality == Criticality.HI else wcet
+        elif wcet_hi < wcet:
+            raise ValueError("HI criticality WCET cannot be smaller than WCET")
+        task = self.__writable(name)
+        self.__add_utilization(wcet - task.wcet, task.period)
+        task.wcet = wcet
+        task.bcet = bcet
+        task.wcet_hi = wcet_hi
+
+    def set_period(self, name: str, period: int, deadline: Optional[int] = None, algorithm: Any = None) -> None:
+        '''
+        Change the period of a task. An implicit deadline (equal to the period) follows the new period.
+
+        Args:
+            name (str): The name of the task.
+            period (int): The new period.
+            deadline (int): The new relative deadline (default: see above).
+            algorithm (SchedulingAlgorithm): Update priorities incrementally with this algorithm (default: None).
+        '''
+
+        task = self.__writable(name)
+        old_period = task.period
+        if deadline is None:
+            deadline = period if task.deadline == old_period else task.deadline
+        self.__add_utilization(-task.wcet, old_period)
+        self.__remove_period(int(old_period))
+        task.period = period
+        task.deadline = deadline
+        self.__add_period(int(period))
+        self.__add_utilization(task.wcet, period)
+        if algorithm is not None:
+            algorithm.update_priorities(self, name, old_period, period)
+
+    def set_priority(self, name: str, priority: int) -> None:
+        '''
+        Change the priority of a task.
+
+        Args:
+            name (str): The name of the task.
+            priority (int): The new priority.
+        '''
+
+        self.__writable(name).priority = priority
+
+    def fork(self) -> 'TaskSet':
+        '''
+        Create a copy-on-write copy of the task set.
+
+        Both sets share their Task objects until either one modifies a task through the
+        methods of this class, which then copies only that task.
+
+        Returns:
+            TaskSet: The new task set.
+        '''
+
+        other = TaskSet.__new__(TaskSet)
+        other.tasks = dict(self.tasks)
+        other._owned = set()
+        other._undo_log = []
+        other._period_counts = dict(self._period_counts)
+        other._utilization_sum = self._utilization_sum
+        other.hyperperiod = self.hyperperiod
+        other.worst_case_utilization = self.worst_case_utilization
+        self._owned = set()
+        return other
+
+    def apply(self, mutation: Any, algorithm: Any = None) -> None:
+        '''
+        Apply a mutation (see model.mutation) and record its inverse so it can be undone.
+
+        Args:
+            mutation (Mutation): The mutation to apply.
+            algorithm (SchedulingAlgorithm): Update priorities incrementally with this algorithm (default: None).
+        '''
 
+        inverse = mutation.apply(self, algorithm)
+        self._undo_log.append((inverse, algorithm))
+
+    def undo(self) -> None:
+        '''
+        Revert the most recent mutation applied with apply.
+        '''
+
+        if not self._undo_log:
+            raise IndexError("No mutation to undo.")
+        inverse, algorithm = self._undo_log.pop()
+        inverse.apply(self, algorithm)
+
+
+    @classmethod
+    def is_csv(cls, file_path: str) -> bool:
+        '''
+        Check whether a file is a taskset CSV, i.e. a readable CSV file whose header has the
+        columns from_csv requires. Other CSV files, such as analysis results, are rejected.
+
+        Args:
+            file_path (str): The path of the file.
+
+        Returns:
+            bool: True if from_csv can read the file, False otherwise.
+        '''
+        try:
+            with open(file_path, mode='r', newline='') as csvfile:
+                header = next(csv.reader(csvfile), [])
+        except (OSError, UnicodeDecodeError, csv.Error):
+            return False
+        return set(cls.CSV_HEADERS[:5]) <= set(header)
+
+    @classmethod
+    def from_csv(cls, file_path: str) -> 'TaskSet':
+        '''
+        Read a TaskSet from a CSV file written by to_csv.
+
+        Args:
+            file_path (str): The path of the CSV file.
+
+        Returns:
+            TaskSet: The tasks in the file, in file order.
+        '''
+        taskset = cls()
+        with open(file_path, mode='r', newline='') as csvfile:
+            for row in csv.DictReader(csvfile):
+                taskset.add_task(Task(
+                    name=row['Task'],
+                    bcet=int(row['BCET']),
+                    wcet=int(row['WCET']),
+                    period=int(row['Period']),
+                    deadline=int(row['Deadline']),
+                    priority=int(row.get('Priority') or 0),
+                    task_type=TaskType(row.get('Type') or 'TT'),
+                    MIT=int(row.get('MIT') or 0),
+                    assigned_server=row.get('Server') or None,
+                    criticality=Criticality(row.get('Criticality') or 'LO'),
+                    wcet_hi=int(row['WCET_HI']) if row.get('WCET_HI') else None,
+                ))
+        return taskset
 
     def to_csv(self, folder: str, file_name: str) -> None:
         '''
@@ -49,19 +252,99 @@ class TaskSet:
         '''
         os.makedirs(folder, exist_ok=True)
         filepath = os.path.join(folder, f"{file_name}.csv")
-        headers = ['Task', 'BCET', 'WCET', 'Period', 'Deadline', 'Priority']
         with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            for task in self.tasks.values():
-                writer.writerow({
-                    'Task': task.name,
-                    'BCET': int(task.bcet),
-                    'WCET': int(task.wcet),
-                    'Period': int(task.period),
-                    'Deadline': int(task.deadline),
-                    'Priority': int(task.priority)
-                })
+            self.write_csv(csvfile)
+
+    def write_csv(self, stream) -> None:
+        '''
+        Write the TaskSet instance in CSV format to an open text stream.
+
+        Args:
+            stream: The text stream to write to.
+        '''
+        writer = csv.DictWriter(stream, fieldnames=self.CSV_HEADERS)
+        writer.writeheader()
+        writer.writerows(self.to_rows())
+
+    def to_rows(self) -> list[dict]:
+        '''
+        Convert the TaskSet instance to one dictionary per task, keyed by the CSV columns.
+
+        Returns:
+            list[dict]: The task rows, in taskset order.
+        '''
+        return [
+            {
+                'Task': task.name,
+                'BCET': int(task.bcet),
+                'WCET': int(task.wcet),
+                'Period': int(task.period),
+                'Deadline': int(task.deadline),
+                'Priority': int(task.priority),
+                'Type': task.task_type.value,
+                'MIT': int(task.MIT),
+                'Server': task.assigned_server if task.assigned_server is not None else '',
+                'Criticality': task.criticality.value,
+                'WCET_HI': int(task.wcet_hi)
+            }
+            for task in self.tasks.values()
+        ]
+
+    def fingerprint(self) -> str:
+        '''
+        Canonical fingerprint of the task set.
+
+        Two task sets have the same fingerprint when they contain the same
+        (bcet, wcet, period, deadline) tuples, regardless of task names, order and priorities.
+        HI criticality tasks add their HI criticality WCET to their tuple, and event-triggered
+        tasks add -1 (never a valid WCET, so the two cannot be confused) and their MIT. Time-triggered
+        LO criticality tasks keep the plain tuple.
+
+        Returns:
+            str: A hex digest identifying the task set.
+        '''
+        canonical = sorted(
+            (int(task.bcet), int(task.wcet), int(task.period), int(task.deadline))
+            + ((int(task.wcet_hi),) if task.criticality == Criticality.HI else ())
+            + ((-1, int(task.MIT)) if task.task_type == TaskType.ET else ())
+            for task in self.tasks.values()
+        )
+        return hashlib.blake2b(repr(canonical).encode(), digest_size=16).hexdigest()
+
+    def iter_jobs(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, Task]]:
+        '''
+        Lazily iterate over the jobs released in [start, end), in release-time order.
+
+        Each task releases its jobs at multiples of its period, so the per-task release
+        sequences are merged with a heap holding one pending job per task. Memory is
+        O(number of tasks) and jobs released before start are never enumerated. Jobs
+        released at the same time are yielded in taskset order.
+
+        Args:
+            start (int): The first release time of the window (default: 0).
+            end (int): The end of the window, exclusive (default: the hyperperiod).
+
+        Yields:
+            Tuple[int, int, Task]: The release time, absolute deadline and task of each job.
+        '''
+        if end is None:
+            end = int(self.hyperperiod)
+
+        heap = []
+        for index, task in enumerate(self.tasks.values()):
+            period = int(task.period)
+            release = -(-start // period) * period  # First multiple of the period >= start
+            if release < end:
+                heap.append((release, index, period, task))
+        heapq.heapify(heap)
+
+        while heap:
+            release, index, period, task = heap[0]
+            yield release, release + int(task.deadline), task
+            if release + period < end:
+                heapq.heapreplace(heap, (release + period, index, period, task))
+            else:
+                heapq.heappop(heap)
 
     def __iter__(self):
         return iter(self.tasks.values())
@@ -69,12 +352,39 @@ class TaskSet:
     def __len__(self):
         return len(self.tasks)
 
+    def __writable(self, name: str) -> Task:
+        task = self.tasks[name]
+        if name not in self._owned:
+            task = copy.copy(task)
+            self.tasks[name] = task
+            self._owned.add(name)
+        return task
+
+    def __add_period(self, period: int) -> None:
+        count = self._period_counts.get(period, 0)
+        self._period_counts[period] = count + 1
+        if count == 0:
+            self.hyperperiod = lcm(int(self.hyperperiod), period) if self.hyperperiod else period
+
+    def __remove_period(self, period: int) -> None:
+        count = self._period_counts[period] - 1
+        if count == 0:
+            del self._period_counts[period]
+            self.hyperperiod = self.__calculate_hyperperiod()
+        else:
+            self._period_counts[period] = count
+
+    def __add_utilization(self, wcet: int, period: int) -> None:
+        if period > 0:
+            self._utilization_sum += Fraction(wcet) / Fraction(period)
+        self.worst_case_utilization = self.__calculate_utilization()
+
     def __calculate_hyperperiod(self) -> float:
-        periods = [int(task.period) for task in self.tasks.values()]
+        periods = list(self._period_counts)
         if not periods:
             return 0.0
         
         return reduce(lcm, periods)
 
     def __calculate_utilization(self) -> float:
-        return round(sum(task.wcet / task.period for task in self.tasks.values() if task.period > 0), 2)
\ No newline at end of file
+        return round(float(self._utilization_sum), 2)
\ No newline at end of file
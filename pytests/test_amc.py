@@ -0,0 +1,91 @@
+import pytest
+from math import inf
+from model import Task, TaskSet, Criticality
+from scheduling import AMCAnalysis, AMCPriorityAssignment, ResponseTimeAnalysis
+from generator import TaskGenerator, TaskRequirements, Requirement
+
+HI = Criticality.HI
+
+class TestAMCAnalysis:
+    def test_response_times(self):
+        taskset = TaskSet([
+            Task("T1", 0, 2, 10, 10, 0),
+            Task("T2", 0, 2, 20, 20, 1, criticality=HI, wcet_hi=4),
+        ])
+
+        lo, hi = AMCAnalysis(taskset).response_times()
+
+        assert lo == {"T1": 2, "T2": 4}
+        # T1 is only counted up to the LO-mode response time of T2
+        assert hi == {"T2": 6}
+
+    def test_hi_mode_miss(self):
+        taskset = TaskSet([
+            Task("T1", 0, 3, 6, 6, 0),
+            Task("T2", 0, 2, 7, 7, 1, criticality=HI, wcet_hi=5),
+        ])
+        analysis = AMCAnalysis(taskset)
+
+        lo, hi = analysis.response_times()
+
+        assert lo["T2"] == 5
+        assert hi["T2"] == 8
+        assert not analysis.is_schedulable()
+
+    def test_lo_tasks_match_response_time_analysis(self):
+        taskset = TaskSet([Task("T1", 0, 1, 6, 6, 1), Task("T2", 0, 4, 60, 60, 2), Task("T3", 0, 2, 12, 12, 0)])
+
+        lo, hi = AMCAnalysis(taskset).response_times()
+
+        assert lo == ResponseTimeAnalysis(taskset).response_times()
+        assert hi == {}
+
+    def test_overloaded_taskset_diverges(self):
+        taskset = TaskSet([Task("T1", 0, 2, 2, 2, 0), Task("T2", 0, 1, 4, 4, 1, criticality=HI, wcet_hi=2)])
+
+        lo, hi = AMCAnalysis(taskset).response_times()
+
+        assert lo["T2"] == inf
+        assert hi["T2"] == inf
+
+class TestAMCPriorityAssignment:
+    def test_hi_task_gets_precedence(self):
+        taskset = TaskSet([
+            Task("T1", 0, 3, 6, 6),
+            Task("T2", 0, 2, 7, 7, criticality=HI, wcet_hi=5),
+        ])
+
+        AMCPriorityAssignment().assign_priorities(taskset)
+
+        # Deadline monotonic order fails in HI mode, the reverse order is schedulable
+        assert taskset.tasks["T2"].priority < taskset.tasks["T1"].priority
+        assert AMCAnalysis(taskset).is_schedulable()
+
+    def test_falls_back_to_deadline_monotonic(self):
+        taskset = TaskSet([
+            Task("T1", 0, 2, 5, 5, criticality=HI, wcet_hi=3),
+            Task("T2", 0, 4, 5, 4),
+        ])
+
+        AMCPriorityAssignment().assign_priorities(taskset)
+
+        assert taskset.tasks["T2"].priority == 0
+        assert taskset.tasks["T1"].priority == 1
+        assert not AMCAnalysis(taskset).is_schedulable()
+
+    def test_generated_dual_criticality_tasksets(self):
+        req = Requirement(name="MC", size=6, utilization=0.5, unique_periods=False,
+                          algorithm=AMCPriorityAssignment(), hi_fraction=0.5, criticality_factor=1.5)
+
+        for taskset in TaskGenerator(TaskRequirements([req]), None).generate_batch(req, 10):
+            hi_tasks = [task for task in taskset if task.criticality == HI]
+            assert len(hi_tasks) == 3
+            assert all(task.wcet_hi == max(task.wcet, round(task.wcet * 1.5)) for task in hi_tasks)
+            assert sorted(task.priority for task in taskset) == list(range(6))
+
+    def test_invalid_criticality_factor(self):
+        req = Requirement(name="MC", size=3, utilization=0.5, unique_periods=False,
+                          algorithm=AMCPriorityAssignment(), hi_fraction=0.5, criticality_factor=0.5)
+
+        with pytest.raises(ValueError, match="Criticality factor"):
+            TaskGenerator(TaskRequirements([req]), None).generate_taskset(req)
@@ -0,0 +1,58 @@
+import pytest
+import os
+from math import inf
+from model import Task, TaskSet
+from scheduling import BreakdownAnalysis, ResponseTimeAnalysis, analyze_folder
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "test_examples")
+
+class TestBreakdownAnalysis:
+    def test_full_utilization_harmonic_taskset(self):
+        taskset = TaskSet([
+            Task("Task_0", 0, 1, 2, 2, 0),
+            Task("Task_1", 0, 1, 4, 4, 1),
+        ])
+
+        analysis = BreakdownAnalysis(taskset)
+
+        # Harmonic periods are schedulable up to full utilization
+        assert analysis.critical_scaling_factor() == pytest.approx(4 / 3, rel=1e-3)
+        assert analysis.breakdown_utilization() == pytest.approx(1.0, rel=1e-3)
+
+    def test_factor_is_critical(self):
+        taskset = TaskSet.from_csv(os.path.join(EXAMPLES, "schedulable", "Medium_Utilization_NonUnique_Periods_taskset.csv"))
+
+        factor = BreakdownAnalysis(taskset, tolerance=1e-5).critical_scaling_factor()
+
+        rta = ResponseTimeAnalysis(taskset)
+        assert rta.is_schedulable(scale=factor)
+        assert not rta.is_schedulable(scale=factor * 1.001)
+
+    def test_bounds_bracket_factor(self):
+        taskset = TaskSet.from_csv(os.path.join(EXAMPLES, "not_schedulable", "Unschedulable_High_Utilization_Unique_Periods_taskset.csv"))
+        analysis = BreakdownAnalysis(taskset)
+
+        lower, upper = analysis.bounds()
+        factor = analysis.critical_scaling_factor()
+
+        assert lower <= factor <= upper
+        assert factor < 1  # Not schedulable as given
+        assert ResponseTimeAnalysis(taskset).is_schedulable(scale=lower)
+
+    def test_empty_taskset(self):
+        assert BreakdownAnalysis(TaskSet()).critical_scaling_factor() == inf
+
+    def test_analyze_folder(self):
+        results = analyze_folder(os.path.join(EXAMPLES, "schedulable"), workers=2)
+
+        assert len(results) == 12
+        assert all(result['ScalingFactor'] >= 1 for result in results)
+
+    def test_analyze_folder_skips_other_csv_files(self, tmpdir):
+        TaskSet([Task("Task_0", 0, 1, 4, 4, 0)]).to_csv(str(tmpdir), "Example_taskset")
+        with open(os.path.join(str(tmpdir), "breakdown.csv"), 'w') as f:
+            f.write("File,Utilization,ScalingFactor,BreakdownUtilization\nx,0.5,2.0,1.0\n")
+
+        results = analyze_folder(str(tmpdir), workers=1)
+
+        assert [os.path.basename(result['File']) for result in results] == ["Example_taskset.csv"]
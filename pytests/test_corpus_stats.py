@@ -0,0 +1,100 @@
+import pytest
+import os
+import random
+from generator import CorpusStatistics, collect_statistics
+from generator.corpus_stats import Histogram, QuantileSketch, iter_corpus, requested_utilization
+from model import Task, TaskSet
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "test_examples")
+
+class TestSketches:
+    def test_histogram_merge(self):
+        first, second = Histogram(0.0, 1.0, 10), Histogram(0.0, 1.0, 10)
+        first.add(0.05)
+        first.add(1.5)
+        second.add(0.05)
+        second.add(-1)
+
+        first.merge(second)
+
+        assert first.counts[0] == 2
+        assert first.overflow == 1
+        assert first.underflow == 1
+
+    def test_histogram_last_bin_includes_high(self):
+        histogram = Histogram(0.0, 1.0, 10)
+        histogram.add(1.0)
+        histogram.add(1.01)
+
+        assert histogram.counts[-1] == 1
+        assert histogram.overflow == 1
+        assert "[0.90, 1.00]" in histogram.render()
+
+    def test_quantile_sketch_relative_accuracy(self):
+        rng = random.Random(3)
+        values = [rng.lognormvariate(5, 2) for _ in range(5000)]
+        first, second = QuantileSketch(0.01), QuantileSketch(0.01)
+        for i, value in enumerate(values):
+            (first if i % 2 else second).add(value)
+
+        first.merge(second)
+
+        values.sort()
+        assert first.count == 5000
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert first.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert first.quantile(0) == values[0]
+        assert first.quantile(1) == values[-1]
+
+    def test_quantile_sketch_zeros(self):
+        sketch = QuantileSketch()
+        for value in (0, 0, 0, 10):
+            sketch.add(value)
+
+        assert sketch.quantile(0.5) == 0.0
+
+class TestCorpusStatistics:
+    def test_add(self):
+        statistics = CorpusStatistics()
+        statistics.add(TaskSet([Task("Task_0", 1, 2, 10, 10), Task("Task_1", 2, 4, 20, 20)]), 0.5)
+        statistics.add(TaskSet([Task("Task_0", 1, 2, 10, 10), Task("Task_1", 2, 4, 10, 10)]))
+
+        assert statistics.tasksets == 2
+        assert statistics.tasks == 4
+        assert statistics.unique_period_sets == 1
+        assert statistics.utilization_deviation.count == 1
+        assert statistics.utilization_deviation.quantile(1) == pytest.approx(0.1)
+        assert statistics.hyperperiod.quantile(1) == 20
+        assert sum(statistics.bcet_wcet_ratio.counts) == 4
+        assert "Tasksets: 2" in statistics.report()
+
+    def test_requested_utilization_from_output_folder(self):
+        assert requested_utilization(os.path.join("out", "0.75_utilization", "A_taskset.csv")) == 0.75
+        assert requested_utilization(os.path.join("out", "A_taskset.csv")) is None
+
+    def test_iter_corpus_list_file(self, tmpdir):
+        listing = os.path.join(str(tmpdir), "corpus.txt")
+        with open(listing, 'w') as f:
+            f.write("a.csv\n\nb.csv\n")
+
+        assert list(iter_corpus(listing)) == ["a.csv", "b.csv"]
+
+    def test_collect_statistics(self):
+        statistics = collect_statistics(EXAMPLES, workers=2, chunk_size=3)
+
+        assert statistics.tasksets == 16
+        assert statistics.tasks == sum(len(TaskSet.from_csv(f)) for f in iter_corpus(EXAMPLES))
+
+    def test_collect_statistics_skips_other_files(self, tmpdir):
+        TaskSet([Task("Task_0", 1, 2, 10, 10)]).to_csv(str(tmpdir), "A_taskset")
+        with open(os.path.join(str(tmpdir), "breakdown.csv"), 'w') as f:
+            f.write("File,Utilization,ScalingFactor,BreakdownUtilization\n")
+        with open(os.path.join(str(tmpdir), "Broken_taskset.csv"), 'w') as f:
+            f.write("Task,BCET,WCET,Period,Deadline\nTask_0,1,two,10,10\n")
+
+        assert [os.path.basename(f) for f in iter_corpus(str(tmpdir))] == ["A_taskset.csv", "Broken_taskset.csv"]
+        statistics = collect_statistics(str(tmpdir), workers=1)
+
+        assert statistics.tasksets == 1
+        assert statistics.skipped == 1
@@ -0,0 +1,63 @@
+import os
+import csv
+from generator import SchedulabilityExperiment, ExperimentPoint
+
+class TestExperimentPoint:
+    def test_confidence_interval_narrows_with_samples(self):
+        point = ExperimentPoint(5, 0.5)
+        point.samples, point.schedulable = 20, 10
+        lower_small, upper_small = point.confidence_interval(0.95)
+
+        point.samples, point.schedulable = 2000, 1000
+        lower_large, upper_large = point.confidence_interval(0.95)
+
+        assert lower_small < 0.5 < upper_small
+        assert upper_large - lower_large < upper_small - lower_small
+
+    def test_confidence_interval_without_samples(self):
+        assert ExperimentPoint(5, 0.5).confidence_interval(0.95) == (0.0, 1.0)
+
+class TestSchedulabilityExperiment:
+    def test_run_stops_when_interval_is_narrow(self, tmpdir):
+        experiment = SchedulabilityExperiment(
+            sizes=[3], utilizations=[0.3], width=0.2, batch_size=10, workers=2, seed=1
+        )
+
+        points = experiment.run()
+
+        assert len(points) == 1
+        # Low utilization sets are always schedulable, so the interval closes quickly
+        assert points[0].schedulable == points[0].samples
+        assert points[0].samples < experiment.max_samples
+        lower, upper = points[0].confidence_interval(experiment.confidence)
+        assert upper - lower <= 0.2
+
+    def test_run_stops_at_max_samples(self):
+        # A width of zero never converges, so every point must stop exactly at max_samples
+        experiment = SchedulabilityExperiment(
+            sizes=[3], utilizations=[0.5, 0.9], width=0.0, batch_size=30, max_samples=100, workers=4, seed=3
+        )
+
+        points = experiment.run()
+
+        assert [point.samples for point in points] == [100, 100]
+
+    def test_infeasible_point_records_error(self):
+        experiment = SchedulabilityExperiment(sizes=[10], utilizations=[0.05], batch_size=5, workers=1)
+
+        points = experiment.run()
+
+        assert points[0].error is not None
+        assert points[0].samples == 0
+
+    def test_to_csv(self, tmpdir):
+        experiment = SchedulabilityExperiment(sizes=[2, 3], utilizations=[0.2], width=0.3, batch_size=5, workers=1, seed=2)
+        experiment.run()
+
+        file_path = os.path.join(str(tmpdir), "experiment.csv")
+        experiment.to_csv(file_path)
+
+        with open(file_path, 'r') as f:
+            rows = list(csv.DictReader(f))
+        assert [int(row['Size']) for row in rows] == [2, 3]
+        assert all(int(row['Samples']) > 0 for row in rows)
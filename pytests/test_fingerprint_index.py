@@ -0,0 +1,44 @@
+import pytest
+import os
+from generator import TaskGenerator, TaskRequirements, Requirement
+from generator.fingerprint_index import FingerprintIndex
+from scheduling import RateMonotonic
+
+class TestFingerprintIndex:
+    def test_add_and_contains(self, tmpdir):
+        index = FingerprintIndex(os.path.join(str(tmpdir), "index"))
+
+        assert index.add("abc")
+        assert not index.add("abc")
+        assert "abc" in index
+        assert "def" not in index
+        assert len(index) == 1
+
+    def test_index_persists(self, tmpdir):
+        path = os.path.join(str(tmpdir), "index")
+        FingerprintIndex(path).add("abc")
+
+        index = FingerprintIndex(path)
+
+        assert "abc" in index
+
+    def test_generator_rejects_duplicates_across_runs(self, tmpdir):
+        # A single task at 50% utilization can only ever be (0, 1, 2, 2)
+        req = Requirement(name="Test", size=1, utilization=0.5, unique_periods=False, algorithm=RateMonotonic())
+        output_dir = str(tmpdir)
+
+        first = TaskGenerator(TaskRequirements([req]), output_dir, unique_sets=True)
+        first.MAX_DUPLICATE_ATTEMPTS = 20
+        first.generate_taskset(req)
+
+        second = TaskGenerator(TaskRequirements([req]), output_dir, unique_sets=True)
+        second.MAX_DUPLICATE_ATTEMPTS = 20
+        with pytest.raises(ValueError, match="differs from the 1 already generated"):
+            second.generate_taskset(req)
+
+    def test_generator_without_unique_sets_allows_duplicates(self, tmpdir):
+        req = Requirement(name="Test", size=1, utilization=0.5, unique_periods=False, algorithm=RateMonotonic())
+        generator = TaskGenerator(TaskRequirements([req]), str(tmpdir))
+
+        assert generator.generate_taskset(req).fingerprint() == generator.generate_taskset(req).fingerprint()
+        assert not os.path.exists(os.path.join(str(tmpdir), TaskGenerator.FINGERPRINT_FILE))
@@ -2,6 +2,7 @@ import pytest
 import os
 import tempfile
 import csv
+import threading
 from generator import TaskGenerator, TaskRequirements
 from model import TaskSet
 from scheduling import RateMonotonic
@@ -59,4 +60,16 @@ class TestIntegration:
             
             # Calculate utilization to verify it's close to 0.3
             utilization = sum([int(row['WCET']) / int(row['Period']) for row in rows])
-            assert abs(utilization - 0.3) <= 0.05
\ No newline at end of file
+            assert abs(utilization - 0.3) <= 0.05
+
+    def test_write_error_stops_loading_animation(self, tmp_config_file, output_dir, monkeypatch):
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(TaskSet, "to_csv", fail)
+        threads = threading.active_count()
+
+        generator = TaskGenerator(TaskRequirements.from_csv(tmp_config_file), output_dir)
+        with pytest.raises(OSError, match="disk full"):
+            generator.generate_tasksets()
+
+        assert threading.active_count() == threads
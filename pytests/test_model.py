@@ -1,5 +1,5 @@
 import pytest
-from model import Task, TaskSet
+from model import Task, TaskSet, TaskType, Criticality
 import os
 import csv
 
@@ -92,4 +92,101 @@ class TestTaskSet:
             assert int(rows[1]['WCET']) == 20
             assert int(rows[1]['Period']) == 200
             assert int(rows[1]['Deadline']) == 200
-            assert int(rows[1]['Priority']) == 2
\ No newline at end of file
+            assert int(rows[1]['Priority']) == 2
+
+    def test_from_csv(self, tmpdir):
+        task1 = Task("Task_1", 5, 10, 100, 100, 1)
+        task2 = Task("Task_2", 10, 20, 200, 200, 2)
+        TaskSet([task1, task2]).to_csv(str(tmpdir), "test_taskset")
+
+        taskset = TaskSet.from_csv(f"{tmpdir}/test_taskset.csv")
+
+        assert [task.name for task in taskset] == ["Task_1", "Task_2"]
+        assert taskset.tasks["Task_2"].wcet == 20
+        assert taskset.tasks["Task_2"].priority == 2
+        assert taskset.hyperperiod == 200
+        assert taskset.worst_case_utilization == 0.2
+
+    def test_from_csv_task_types(self, tmpdir):
+        task1 = Task("Task_1", 5, 10, 100, 100, 0)
+        task2 = Task("Task_2", 10, 20, 200, 150, 1, task_type=TaskType.ET, MIT=200)
+        TaskSet([task1, task2]).to_csv(str(tmpdir), "test_taskset")
+
+        taskset = TaskSet.from_csv(f"{tmpdir}/test_taskset.csv")
+
+        assert taskset.tasks["Task_1"].task_type == TaskType.TT
+        assert taskset.tasks["Task_2"].task_type == TaskType.ET
+        assert taskset.tasks["Task_2"].MIT == 200
+        assert taskset.tasks["Task_2"].assigned_server is None
+
+    def test_from_csv_criticality(self, tmpdir):
+        task1 = Task("Task_1", 5, 10, 100, 100, 0)
+        task2 = Task("Task_2", 10, 20, 200, 200, 1, criticality=Criticality.HI, wcet_hi=40)
+        TaskSet([task1, task2]).to_csv(str(tmpdir), "test_taskset")
+
+        taskset = TaskSet.from_csv(f"{tmpdir}/test_taskset.csv")
+
+        assert taskset.tasks["Task_1"].criticality == Criticality.LO
+        assert taskset.tasks["Task_1"].wcet_hi == 10
+        assert taskset.tasks["Task_2"].criticality == Criticality.HI
+        assert taskset.tasks["Task_2"].wcet_hi == 40
+
+    def test_set_wcet_keeps_hi_wcet(self):
+        taskset = TaskSet([
+            Task("Task_1", 1, 2, 10, 10, 0),
+            Task("Task_2", 1, 2, 10, 10, 1, criticality=Criticality.HI, wcet_hi=6),
+        ])
+
+        taskset.set_wcet("Task_1", 3)
+        taskset.set_wcet("Task_2", 3)
+
+        assert taskset.tasks["Task_1"].wcet_hi == 3
+        assert taskset.tasks["Task_2"].wcet_hi == 6
+        with pytest.raises(ValueError):
+            taskset.set_wcet("Task_2", 3, wcet_hi=2)
+
+    def test_iter_jobs(self):
+        task1 = Task("Task_1", 1, 2, 4, 4, 0)
+        task2 = Task("Task_2", 1, 3, 6, 5, 1)
+        taskset = TaskSet([task1, task2])
+
+        jobs = [(release, deadline, task.name) for release, deadline, task in taskset.iter_jobs()]
+
+        assert jobs == [
+            (0, 4, "Task_1"), (0, 5, "Task_2"), (4, 8, "Task_1"),
+            (6, 11, "Task_2"), (8, 12, "Task_1"),
+        ]
+
+    def test_iter_jobs_window(self):
+        task1 = Task("Task_1", 1, 2, 1000, 1000, 0)
+        task2 = Task("Task_2", 1, 3, 999999937, 999999937, 1)
+        taskset = TaskSet([task1, task2])
+
+        start = 10**9 - 3000
+        jobs = list(taskset.iter_jobs(start, start + 2000))
+
+        assert [release for release, _, _ in jobs] == [999997000, 999998000]
+        assert all(task.name == "Task_1" for _, _, task in jobs)
+
+    def test_iter_jobs_empty_window(self):
+        taskset = TaskSet([Task("Task_1", 1, 2, 4, 4, 0)])
+
+        assert list(taskset.iter_jobs(5, 5)) == []
+
+    def test_fingerprint_ignores_names_and_order(self):
+        taskset1 = TaskSet([Task("Task_1", 5, 10, 100, 100, 1), Task("Task_2", 10, 20, 200, 200, 2)])
+        taskset2 = TaskSet([Task("A", 10, 20, 200, 200, 0), Task("B", 5, 10, 100, 100, 0)])
+        taskset3 = TaskSet([Task("Task_1", 5, 10, 100, 100, 1), Task("Task_2", 10, 21, 200, 200, 2)])
+
+        assert taskset1.fingerprint() == taskset2.fingerprint()
+        assert taskset1.fingerprint() != taskset3.fingerprint()
+
+    def test_fingerprint_includes_task_type_and_mit(self):
+        tt = TaskSet([Task("Task_1", 5, 10, 100, 100, 0)])
+        et = TaskSet([Task("Task_1", 5, 10, 100, 100, 0, task_type=TaskType.ET, MIT=100)])
+        et_other_mit = TaskSet([Task("Task_1", 5, 10, 100, 100, 0, task_type=TaskType.ET, MIT=150)])
+        et_hi = TaskSet([Task("Task_1", 5, 10, 100, 100, 0, task_type=TaskType.ET, MIT=100,
+                              criticality=Criticality.HI, wcet_hi=20)])
+
+        fingerprints = {tt.fingerprint(), et.fingerprint(), et_other_mit.fingerprint(), et_hi.fingerprint()}
+        assert len(fingerprints) == 4
@@ -0,0 +1,127 @@
+import pytest
+import random
+from model import Task, TaskSet, SetWcet, SetPeriod, SwapPeriods, AddTask, RemoveTask
+from scheduling import RateMonotonic
+
+def snapshot(taskset):
+    return {task.name: (task.bcet, task.wcet, task.period, task.deadline, task.priority) for task in taskset}
+
+class TestMutation:
+    @pytest.fixture
+    def taskset(self):
+        taskset = TaskSet([
+            Task("Task_0", 1, 2, 10, 10),
+            Task("Task_1", 1, 3, 20, 20),
+            Task("Task_2", 2, 4, 20, 20),
+            Task("Task_3", 1, 5, 50, 50),
+        ])
+        RateMonotonic().assign_priorities(taskset)
+        return taskset
+
+    def test_set_wcet_updates_utilization(self, taskset):
+        taskset.apply(SetWcet("Task_0", 5))
+
+        assert taskset.tasks["Task_0"].wcet == 5
+        assert taskset.worst_case_utilization == 0.95
+
+        taskset.undo()
+        assert taskset.tasks["Task_0"].wcet == 2
+        assert taskset.worst_case_utilization == 0.65
+
+    def test_set_period_updates_hyperperiod_and_priorities(self, taskset):
+        rm = RateMonotonic()
+        taskset.apply(SetPeriod("Task_3", 5), rm)
+
+        assert taskset.hyperperiod == 20
+        assert taskset.tasks["Task_3"].deadline == 5
+        assert taskset.tasks["Task_3"].priority == 0
+        assert taskset.tasks["Task_0"].priority == 1
+        assert taskset.tasks["Task_1"].priority == 2
+
+        taskset.undo()
+        assert taskset.hyperperiod == 100
+        assert taskset.tasks["Task_3"].priority == 3
+
+    def test_add_and_remove_task(self, taskset):
+        rm = RateMonotonic()
+        before = snapshot(taskset)
+
+        taskset.apply(AddTask(Task("Task_4", 0, 1, 7, 7)), rm)
+        assert taskset.hyperperiod == 700
+        assert taskset.tasks["Task_4"].priority == 0
+        assert taskset.tasks["Task_3"].priority == 4
+
+        taskset.apply(RemoveTask("Task_1"), rm)
+        assert "Task_1" not in taskset.tasks
+        assert taskset.tasks["Task_2"].priority == 2
+
+        taskset.undo()
+        taskset.undo()
+        assert snapshot(taskset) == before
+        assert taskset.hyperperiod == 100
+
+    def test_undo_without_mutation_raises_error(self, taskset):
+        with pytest.raises(IndexError):
+            taskset.undo()
+
+    def test_fork_is_copy_on_write(self, taskset):
+        before = snapshot(taskset)
+        fork = taskset.fork()
+
+        fork.apply(SetWcet("Task_1", 10))
+        # Unmodified tasks are still shared
+        assert fork.tasks["Task_2"] is taskset.tasks["Task_2"]
+        assert fork.tasks["Task_1"] is not taskset.tasks["Task_1"]
+
+        fork.apply(SwapPeriods("Task_0", "Task_3"), RateMonotonic())
+        taskset.apply(SetWcet("Task_2", 3))
+
+        assert fork.tasks["Task_0"].period == 50
+        assert fork.tasks["Task_3"].period == 10
+        assert fork.tasks["Task_2"].wcet == 4
+        taskset.undo()
+        assert snapshot(taskset) == before
+
+    def test_incremental_matches_full_recomputation(self, taskset):
+        rng = random.Random(7)
+        rm = RateMonotonic()
+        before = snapshot(taskset)
+        next_name = 4
+
+        for _ in range(300):
+            names = list(taskset.tasks)
+            choice = rng.random()
+            if choice < 0.3:
+                taskset.apply(SetPeriod(rng.choice(names), rng.choice([5, 10, 20, 25, 50, 100])), rm)
+            elif choice < 0.5 and len(names) > 1:
+                taskset.apply(SwapPeriods(*rng.sample(names, 2)), rm)
+            elif choice < 0.7:
+                taskset.apply(SetWcet(rng.choice(names), rng.randint(1, 5)), rm)
+            elif choice < 0.85 or len(names) == 1:
+                taskset.apply(AddTask(Task(f"Task_{next_name}", 0, 1, rng.choice([4, 10, 30]), 30)), rm)
+                next_name += 1
+            else:
+                taskset.apply(RemoveTask(rng.choice(names)), rm)
+
+            reference = TaskSet(list(taskset))
+            rm.assign_priorities(reference)
+            assert taskset.hyperperiod == reference.hyperperiod
+            assert taskset.worst_case_utilization == reference.worst_case_utilization
+            assert {t.name: t.priority for t in taskset} == {t.name: t.priority for t in reference}
+
+        for _ in range(300):
+            taskset.undo()
+        assert snapshot(taskset) == before
+
+    def test_utilization_does_not_drift(self):
+        rng = random.Random(11)
+        taskset = TaskSet([Task("Task_0", 0, 1, 8, 8)])
+
+        for i in range(1, 500):
+            taskset.apply(AddTask(Task(f"Task_{i}", 0, rng.randint(1, 3), rng.choice([3, 7, 11, 13]), 13)))
+            taskset.apply(SetWcet(f"Task_{i}", rng.randint(1, 2)))
+            taskset.apply(RemoveTask(f"Task_{i}"))
+
+        # Only 1/8 is left; a float running sum would be off by the rounding of every update
+        assert taskset._utilization_sum == TaskSet(list(taskset))._utilization_sum == 0.125
+        assert taskset.worst_case_utilization == 0.12
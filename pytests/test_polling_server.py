@@ -0,0 +1,129 @@
+import pytest
+import random
+from math import inf
+from model import Task, TaskSet, TaskType
+from scheduling import PollingServerSearch, ResponseTimeAnalysis
+
+@pytest.fixture
+def mixed_taskset():
+    return TaskSet([
+        Task("TT_1", 1, 2, 10, 10),
+        Task("TT_2", 1, 3, 20, 20),
+        Task("TT_3", 1, 5, 40, 40),
+        Task("ET_1", 1, 2, 30, 25, task_type=TaskType.ET, MIT=30),
+        Task("ET_2", 1, 3, 50, 50, task_type=TaskType.ET, MIT=50),
+    ])
+
+def exhaustive_search(search, periods):
+    best = None
+    for period in periods:
+        for budget in range(1, period + 1):
+            candidate = search.evaluate(budget, period)
+            if candidate is not None and (best is None or candidate.cost < best.cost):
+                best = candidate
+    return best
+
+class TestPollingServerSearch:
+    def test_requires_event_triggered_tasks(self):
+        with pytest.raises(ValueError):
+            PollingServerSearch(TaskSet([Task("TT_1", 1, 2, 10, 10)]))
+
+    def test_et_response_time_bound(self, mixed_taskset):
+        search = PollingServerSearch(mixed_taskset)
+
+        wcrt = search.et_response_times(budget=2, period=5, server_response_time=2)
+
+        # ET_1 fits in one budget: one period to the next poll plus the server response
+        assert wcrt["ET_1"] == 7
+        # ET_2 waits for ET_1: 5 units of work need three polls
+        assert wcrt["ET_2"] == 17
+
+    def test_et_response_time_diverges(self, mixed_taskset):
+        search = PollingServerSearch(mixed_taskset)
+
+        wcrt = search.et_response_times(budget=1, period=20, server_response_time=1)
+
+        assert wcrt["ET_1"] == 41
+        assert wcrt["ET_2"] == inf
+
+    def test_evaluate_rejects_overload(self, mixed_taskset):
+        search = PollingServerSearch(mixed_taskset)
+
+        assert search.evaluate(budget=5, period=5) is None
+        design = search.evaluate(budget=1, period=5)
+        assert design.tt_response_times["TT_3"] <= 40
+
+    def test_search_matches_exhaustive(self, mixed_taskset):
+        search = PollingServerSearch(mixed_taskset)
+
+        design = search.search()
+
+        exhaustive = exhaustive_search(search, range(1, 51))
+        assert design.cost == exhaustive.cost
+        assert design.et_misses == 0
+
+        periods = [7, 12, 25, 40]
+        assert search.search(periods).cost == exhaustive_search(search, periods).cost
+
+    def test_search_prefers_smaller_budget(self):
+        # The largest schedulable budget (9) gives a WCRT of 19, but one unit per poll is enough
+        taskset = TaskSet([
+            Task("A", 0, 1, 100, 100),
+            Task("E", 0, 1, 40, 40, task_type=TaskType.ET, MIT=40),
+        ])
+        search = PollingServerSearch(taskset)
+
+        design = search.search(range(10, 11))
+
+        assert design.budget == 1
+        assert design.et_response_times["E"] == search.evaluate(1, 10).et_response_times["E"] == 11
+
+    def test_search_returns_design_with_misses(self):
+        # The ET load (0.6) exceeds the capacity the TT task leaves (0.5), so every design misses
+        taskset = TaskSet([
+            Task("TT_1", 0, 5, 10, 10),
+            Task("ET_1", 0, 6, 10, 10, task_type=TaskType.ET, MIT=10),
+        ])
+        search = PollingServerSearch(taskset)
+
+        design = search.search()
+
+        assert design is not None and design.et_misses == 1
+        assert design.cost == exhaustive_search(search, range(1, 11)).cost
+
+    def test_search_matches_exhaustive_random(self):
+        rng = random.Random(5)
+        for _ in range(30):
+            tasks = [Task(f"TT_{i}", 0, rng.randint(1, 3), period, period)
+                     for i, period in enumerate(rng.sample([8, 10, 12, 15, 20, 30], 2))]
+            for i in range(rng.randint(1, 3)):
+                mit = rng.choice([10, 20, 25, 40])
+                tasks.append(Task(f"ET_{i}", 0, rng.randint(1, 4), mit, rng.randint(mit // 2, mit),
+                                  task_type=TaskType.ET, MIT=mit))
+            search = PollingServerSearch(TaskSet(tasks))
+            periods = range(1, max(task.deadline for task in search.et_tasks) + 1)
+
+            design, exhaustive = search.search(), exhaustive_search(search, periods)
+
+            assert (design is None) == (exhaustive is None)
+            if design is not None:
+                assert design.cost == exhaustive.cost
+
+    def test_search_keeps_tt_schedulable(self, mixed_taskset):
+        design = PollingServerSearch(mixed_taskset).search(range(2, 20, 3))
+
+        server = Task(PollingServerSearch.SERVER_NAME, 0, design.budget, design.period, design.period, 0)
+        tt_tasks = [task for task in mixed_taskset if task.task_type == TaskType.TT]
+        taskset = TaskSet([server] + tt_tasks)
+        for priority, task in enumerate(sorted(taskset, key=lambda task: task.period)):
+            taskset.set_priority(task.name, priority)
+        assert ResponseTimeAnalysis(taskset).is_schedulable()
+        assert design.period in range(2, 20, 3)
+
+    def test_search_infeasible(self):
+        taskset = TaskSet([
+            Task("TT_1", 1, 10, 10, 10),
+            Task("ET_1", 1, 1, 10, 10, task_type=TaskType.ET, MIT=10),
+        ])
+
+        assert PollingServerSearch(taskset).search() is None
@@ -0,0 +1,55 @@
+import os
+import pstats
+import threading
+import tracemalloc
+import shutil
+import tempfile
+import pytest
+from generator import GenerationProfile, TaskGenerator, TaskRequirements, Requirement
+from scheduling import RateMonotonic
+
+class TestGenerationProfile:
+    @pytest.fixture
+    def output_dir(self):
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_records_peak_memory(self):
+        with GenerationProfile() as profile:
+            data = [0] * 100000
+            del data
+
+        assert profile.peak_memory >= 100000 * 8
+        assert profile.elapsed > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_save(self, output_dir):
+        with GenerationProfile(top=5) as profile:
+            sorted(range(1000), key=lambda x: -x)
+
+        profile_path, summary_path = profile.save(os.path.join(output_dir, "nested"), "run")
+
+        assert pstats.Stats(profile_path).total_calls > 0
+        with open(summary_path) as file:
+            summary = file.read()
+        assert "Peak memory" in summary
+        assert "Top 5 functions by cumulative time" in summary
+
+    def test_generate_tasksets_profiles_each_requirement(self, output_dir, capsys):
+        rm = RateMonotonic()
+        requirements = TaskRequirements([
+            Requirement(name="A", size=3, utilization=0.5, unique_periods=False, algorithm=rm),
+            Requirement(name="B", size=4, utilization=0.8, unique_periods=False, algorithm=rm),
+        ])
+        threads = threading.active_count()
+
+        TaskGenerator(requirements, output_dir, profile_top=10).generate_tasksets()
+
+        # No loading animation thread is started while profiling
+        assert threading.active_count() == threads
+        for folder, name in (("0.5_utilization", "A"), ("0.8_utilization", "B")):
+            stats = pstats.Stats(os.path.join(output_dir, folder, f"{name}_taskset.prof"))
+            assert any(function == "generate_batch" for _, _, function in stats.stats)
+            assert not any(function == "animate" for _, _, function in stats.stats)
+            assert os.path.exists(os.path.join(output_dir, folder, f"{name}_taskset_profile.txt"))
@@ -0,0 +1,42 @@
+import os
+from model import Task, TaskSet
+from scheduling import Solution, RegressionCase, find_cases, run_regression
+from scheduling.regression import run_case
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+SOLUTIONS = os.path.join(ROOT, "solution")
+EXAMPLES = os.path.join(ROOT, "test_examples")
+
+class TestRegression:
+    def test_parse_solution(self):
+        solution = Solution.from_file(os.path.join(SOLUTIONS, "solution_exercise-TC2.txt"))
+
+        assert len(solution.taskset) == 11
+        assert solution.schedulable is False
+        assert solution.wcrt["T1"] == 1.0
+        assert solution.wcrt["T11"] == 580.0
+
+    def test_find_cases(self):
+        cases = {case.name: case for case in find_cases(SOLUTIONS, EXAMPLES)}
+
+        assert len(cases) == 19
+        # Solutions without a matching example are analyzed on their header taskset
+        assert cases["exercise-TC1"].taskset_file is None
+        assert cases["Low_Utilization_NonUnique_Periods_taskset"].solution_file is not None
+        assert cases["Low_Utilization_Unique_Periods_taskset"].schedulable is True
+
+    def test_reference_corpus(self):
+        results = run_regression(SOLUTIONS, EXAMPLES, workers=2)
+
+        failures = {result.case.name: result.differences for result in results if not result.passed}
+        assert failures == {}
+
+    def test_detects_wrong_verdict(self, tmpdir):
+        TaskSet([Task("Task_0", 0, 3, 4, 4, 0), Task("Task_1", 0, 3, 6, 6, 1)]).to_csv(str(tmpdir), "overloaded")
+        case = RegressionCase("overloaded", os.path.join(str(tmpdir), "overloaded.csv"), None, schedulable=True)
+
+        result = run_case(case)
+
+        assert not result.passed
+        assert "verdict" in result.differences[0]
+        assert result.elapsed > 0
@@ -0,0 +1,107 @@
+import pytest
+import asyncio
+import csv
+import io
+import json
+import os
+import socket
+import threading
+from generator import GenerationService, request_tasksets
+
+REQUIREMENT = {"Name": "Test", "Size": 5, "Utilization": 0.5, "UniquePeriods": False, "PriorityAssignment": "RM"}
+
+class TestGenerationService:
+    @pytest.fixture
+    def socket_path(self, tmpdir):
+        path = os.path.join(str(tmpdir), "generator.sock")
+        loop = asyncio.new_event_loop()
+        service = GenerationService(workers=1)
+        ready = threading.Event()
+
+        async def serve():
+            await service.start()
+            server = await service.serve_unix(path)
+            ready.set()
+            async with server:
+                await server.serve_forever()
+
+        task = loop.create_task(serve())
+
+        def run():
+            try:
+                loop.run_until_complete(task)
+            except asyncio.CancelledError:
+                pass
+            loop.close()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        assert ready.wait(timeout=30)
+        yield path
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join(timeout=30)
+        service.close()
+
+    def test_json_response(self, socket_path):
+        responses = request_tasksets([REQUIREMENT], socket_path=socket_path)
+
+        assert len(responses) == 1
+        assert responses[0]['name'] == "Test"
+        rows = responses[0]['taskset']
+        assert len(rows) == 5
+        assert abs(sum(row['WCET'] / row['Period'] for row in rows) - 0.5) <= 0.05
+
+    def test_csv_response(self, socket_path):
+        responses = request_tasksets([REQUIREMENT], socket_path=socket_path, output_format='csv')
+
+        rows = list(csv.DictReader(io.StringIO(responses[0]['taskset'])))
+        assert len(rows) == 5
+
+    def test_batch_with_error(self, socket_path):
+        invalid = dict(REQUIREMENT, Name="Invalid", Size=100)
+
+        responses = request_tasksets([REQUIREMENT, invalid, REQUIREMENT], socket_path=socket_path)
+
+        assert [response['index'] for response in responses] == [0, 1, 2]
+        assert 'taskset' in responses[0] and 'taskset' in responses[2]
+        assert "at least 1% utilization" in responses[1]['error']
+
+    def test_invalid_request(self, socket_path):
+        with pytest.raises(ValueError, match="Invalid request"):
+            request_tasksets([{"Name": "Missing columns"}], socket_path=socket_path)
+
+    def test_invalid_request_keeps_id(self, socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection, connection.makefile('rwb') as stream:
+            connection.connect(socket_path)
+            stream.write(json.dumps({"id": 7, "requirements": [{"Name": "Missing columns"}]}).encode() + b'\n')
+            stream.flush()
+            response = json.loads(stream.readline())
+
+        assert response['id'] == 7
+        assert response['done'] and "Invalid request" in response['error']
+
+    def test_serve_unix_keeps_other_files(self, tmpdir):
+        path = os.path.join(str(tmpdir), "generator.sock")
+        with open(path, 'w') as f:
+            f.write("not a socket")
+
+        with pytest.raises(FileExistsError):
+            asyncio.run(GenerationService(workers=1).serve_unix(path))
+        assert os.path.isfile(path)
+
+    def test_serve_unix_replaces_and_removes_socket(self, tmpdir):
+        path = os.path.join(str(tmpdir), "generator.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        service = GenerationService(workers=1)
+
+        async def serve_once():
+            server = await service.serve_unix(path)
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(serve_once())
+        assert os.path.exists(path)
+        service.close()
+        assert not os.path.exists(path)
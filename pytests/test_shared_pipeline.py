@@ -0,0 +1,71 @@
+import multiprocessing
+import pytest
+from generator import TasksetRing, Requirement, run_pipeline
+from model import Task, TaskSet, TaskType
+from scheduling import RateMonotonic
+
+@pytest.fixture
+def taskset():
+    return TaskSet([
+        Task("Task_0", 1, 2, 10, 10, 0),
+        Task("Task_1", 2, 5, 20, 15, 1, task_type=TaskType.ET, MIT=20),
+    ])
+
+def _put_from_child(ring, taskset):
+    ring.put(taskset, tag=7)
+
+class TestTasksetRing:
+    def test_round_trip(self, taskset):
+        ring = TasksetRing(slots=2, max_tasks=4)
+        try:
+            ring.put(taskset, tag=3)
+            tag, copy = ring.get()
+        finally:
+            ring.close()
+
+        assert tag == 3
+        assert copy.to_rows() == taskset.to_rows()
+
+    def test_sentinel_and_backpressure(self, taskset):
+        ring = TasksetRing(slots=1, max_tasks=2)
+        try:
+            ring.put(taskset)
+            # The ring is full until the taskset is read
+            assert not ring.put_sentinel(timeout=0.1)
+            assert ring.get() is not None
+            assert ring.put_sentinel(timeout=0.1)
+            assert ring.get() is None
+        finally:
+            ring.close()
+
+    def test_rejects_invalid_tasksets(self, taskset):
+        ring = TasksetRing(slots=1, max_tasks=1)
+        try:
+            with pytest.raises(ValueError):
+                ring.put(taskset)
+            with pytest.raises(ValueError):
+                ring.put(TaskSet([Task("Task_0", 0.5, 2, 10, 10)]))
+        finally:
+            ring.close()
+
+    def test_handoff_between_processes(self, taskset):
+        ring = TasksetRing(slots=2, max_tasks=2)
+        try:
+            process = multiprocessing.Process(target=_put_from_child, args=(ring, taskset))
+            process.start()
+            tag, copy = ring.get()
+            process.join()
+        finally:
+            ring.close()
+
+        assert tag == 7
+        assert copy.to_rows() == taskset.to_rows()
+
+    def test_run_pipeline(self):
+        req = Requirement(name="Test", size=5, utilization=0.7, unique_periods=False, algorithm=RateMonotonic())
+
+        result = run_pipeline(req, 50, producers=2, consumers=2, slots=4, batch_size=8, seed=1)
+
+        assert result.generated == 50
+        assert 0 <= result.schedulable <= 50
+        assert result.throughput > 0
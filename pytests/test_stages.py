@@ -0,0 +1,194 @@
+import pytest
+import random
+import tempfile
+import os
+from generator import TaskGenerator, TaskRequirements, Requirement
+from generator.stages import (
+    PeriodGenerator, UUniFastSampler, BaselineUtilizationSampler, DefaultTaskBuilder,
+    LogUniformPeriods, ListPeriods, HarmonicPeriods, PeriodPool, log_uniform_pool, shortest_period,
+    PERIOD_GENERATORS, register_stage,
+)
+from scheduling import RateMonotonic, ResponseTimeAnalysis
+
+class FixedPeriods(PeriodGenerator):
+    def generate(self, unique, utilization):
+        return [100 * (i + 1) for i in range(len(utilization))]
+
+class TestStages:
+    def test_uunifast_sampler(self):
+        values = UUniFastSampler().sample(8, 0.7, 1.0)
+
+        assert len(values) == 8
+        assert abs(sum(values) - 0.7) < 1e-9
+        assert all(0.01 <= u <= 1.0 for u in values)
+
+    def test_sample_batch(self):
+        batch = BaselineUtilizationSampler().sample_batch(4, 5, 0.5, 1.0)
+
+        assert len(batch) == 4
+        assert all(len(values) == 5 for values in batch)
+
+    def test_build_batch(self):
+        tasksets = DefaultTaskBuilder().build_batch([[0.1, 0.2], [0.5]], [[10, 20], [2]])
+
+        assert [len(taskset) for taskset in tasksets] == [2, 1]
+        assert tasksets[0].tasks["Task_1"].wcet == 4
+
+    def test_register_stage_rejects_wrong_interface(self):
+        with pytest.raises(TypeError):
+            register_stage('PeriodMode', 'invalid', UUniFastSampler)
+        with pytest.raises(ValueError):
+            register_stage('Unknown', 'invalid', FixedPeriods)
+
+    def test_registered_stage_selected_from_csv(self):
+        register_stage('PeriodMode', 'fixed', FixedPeriods)
+        try:
+            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+                f.write("Name,Size,Utilization,UniquePeriods,PriorityAssignment,UtilSampler,PeriodMode\n")
+                f.write("Test1,3,0.6,false,RM,uunifast,fixed\n")
+                csv_path = f.name
+            reqs = TaskRequirements.from_csv(csv_path)
+            os.remove(csv_path)
+
+            req = reqs.requirements[0]
+            assert req.util_sampler == 'uunifast'
+            assert req.period_mode == 'fixed'
+            taskset = TaskGenerator(reqs, None).generate_taskset(req)
+            assert sorted(task.period for task in taskset) == [100, 200, 300]
+        finally:
+            del PERIOD_GENERATORS['fixed']
+
+    def test_unknown_stage_raises_error(self):
+        req = Requirement(name="Test", size=3, utilization=0.5, unique_periods=False,
+                          algorithm=RateMonotonic(), util_sampler='missing')
+
+        with pytest.raises(ValueError, match="Unknown utilization sampler"):
+            TaskGenerator(TaskRequirements([req]), None).generate_taskset(req)
+
+    def test_generate_batch(self):
+        req = Requirement(name="Test", size=5, utilization=0.5, unique_periods=True, algorithm=RateMonotonic())
+
+        tasksets = TaskGenerator(TaskRequirements([req]), None).generate_batch(req, 10)
+
+        assert len(tasksets) == 10
+        for taskset in tasksets:
+            assert len(taskset) == 5
+            assert abs(taskset.worst_case_utilization - 0.5) <= 0.05
+            periods = [task.period for task in taskset]
+            assert len(periods) == len(set(periods))
+
+    def test_period_pool_alias_distribution(self):
+        pool = PeriodPool([10, 20, 30], [1.0, 2.0, 5.0])
+
+        draws = [pool.sample() for _ in range(40000)]
+
+        assert abs(draws.count(30) / len(draws) - 5 / 8) < 0.02
+        assert abs(draws.count(10) / len(draws) - 1 / 8) < 0.02
+
+    def test_period_pool_unique(self):
+        pool = PeriodPool([1, 2, 3, 4], [100.0, 1.0, 1.0, 1.0])
+
+        assert sorted(pool.sample_unique(4)) == [1, 2, 3, 4]
+        with pytest.raises(ValueError):
+            pool.sample_unique(5)
+
+    def test_period_pool_minimum(self):
+        pool = PeriodPool([1, 2, 5, 100], [10.0, 10.0, 10.0, 1.0])
+
+        assert {pool.sample(3) for _ in range(200)} == {5, 100}
+        assert pool.sample(1000) == 100
+        assert pool.sample_unique(2, [50, 3]) == [100, 5]
+
+    def test_log_uniform_periods(self):
+        generator = LogUniformPeriods(10, 1000, 10)
+
+        periods = generator.generate(True, [0.1] * 20)
+
+        assert len(set(periods)) == 20
+        assert all(10 <= p <= 1000 and p % 10 == 0 for p in periods)
+        # The pool is built once per set of parameters
+        assert LogUniformPeriods(10, 1000, 10).pool is generator.pool
+
+    def test_log_uniform_pool_is_uniform_per_decade(self):
+        pool = log_uniform_pool(10, 1000, 1)
+
+        draws = [pool.sample() for _ in range(20000)]
+
+        below = sum(p < 100 for p in draws) / len(draws)
+        assert abs(below - 0.5) < 0.03
+
+    def test_invalid_log_uniform_parameters(self):
+        with pytest.raises(ValueError):
+            LogUniformPeriods(None, 100)
+        with pytest.raises(ValueError):
+            LogUniformPeriods(100, 10)
+        with pytest.raises(ValueError):
+            LogUniformPeriods(11, 19, 10)
+
+    def test_list_periods(self):
+        periods = ListPeriods((1, 2, 5, 10)).generate(False, [0.1] * 50)
+
+        assert set(periods) <= {1, 2, 5, 10}
+        with pytest.raises(ValueError):
+            ListPeriods((1, 2)).generate(True, [0.1] * 3)
+
+    def test_list_periods_skip_periods_too_short_for_utilization(self):
+        # A WCET of 1 in a period of 1 or 2 would give every task 50% to 100% utilization
+        req = Requirement("Tiny", 10, 0.3, False, RateMonotonic(), period_mode='list', periods=[1, 2, 5, 100, 1000])
+        generator = TaskGenerator(TaskRequirements([req]), None)
+        random.seed(4)
+
+        for taskset in generator.generate_batch(req, 20):
+            assert abs(taskset.worst_case_utilization - 0.3) <= 0.02
+            assert all(task.period >= 5 for task in taskset)
+
+    def test_shortest_period(self):
+        assert shortest_period(0.25) == 4
+        assert shortest_period(0.3) == 4
+        assert shortest_period(0.0) == 0
+
+    def test_build_preserves_utilization(self):
+        # Rounding every WCET on its own would give 3 * 2/7, error diffusion gives 1/7 + 2/7 + 1/7
+        taskset = DefaultTaskBuilder().build([0.2, 0.2, 0.2], [7, 7, 7])
+
+        assert [task.wcet for task in taskset] == [1, 2, 1]
+
+    def test_period_distribution_from_csv(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            f.write("Name,Size,Utilization,UniquePeriods,PriorityAssignment,PeriodMode,PeriodMin,PeriodMax,PeriodGranularity,Periods\n")
+            f.write("Log,8,0.6,true,RM,loguniform,10,10000,10,\n")
+            f.write("Auto,6,0.5,false,RM,list,,,,1;2;5;10;20;50;100;200;1000\n")
+            csv_path = f.name
+        reqs = TaskRequirements.from_csv(csv_path)
+        os.remove(csv_path)
+        generator = TaskGenerator(reqs, None)
+
+        log_req, list_req = reqs.requirements
+        assert (log_req.period_min, log_req.period_max, log_req.period_granularity) == (10, 10000, 10)
+        assert list_req.periods == [1, 2, 5, 10, 20, 50, 100, 200, 1000]
+        taskset = generator.generate_taskset(log_req)
+        assert all(task.period % 10 == 0 for task in taskset)
+        assert abs(taskset.worst_case_utilization - 0.6) <= 0.05
+        taskset = generator.generate_taskset(list_req)
+        assert all(task.period in list_req.periods for task in taskset)
+
+    def test_harmonic_chain(self):
+        chain = HarmonicPeriods(5, 500).chain(6)
+
+        assert chain[0] == 5 and chain[-1] <= 500
+        assert all(b % a == 0 and b > a for a, b in zip(chain, chain[1:]))
+        with pytest.raises(ValueError):
+            HarmonicPeriods(5, 100).chain(6)
+
+    def test_harmonic_requirement(self):
+        req = Requirement(name="Test", size=8, utilization=0.9, unique_periods=False,
+                          algorithm=RateMonotonic(), harmonic=True)
+
+        for taskset in TaskGenerator(TaskRequirements([req]), None).generate_batch(req, 20):
+            periods = sorted(task.period for task in taskset)
+            assert taskset.hyperperiod == periods[-1]
+            assert all(b % a == 0 for a, b in zip(periods, periods[1:]))
+            analysis = ResponseTimeAnalysis(taskset)
+            assert analysis.harmonic
+            response_times = analysis.response_times()
+            assert analysis.is_schedulable() == all(response_times[t.name] <= t.deadline for t in taskset)
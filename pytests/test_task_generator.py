@@ -3,7 +3,7 @@ import os
 import shutil
 import tempfile
 from generator import TaskGenerator, TaskRequirements, Requirement
-from model import TaskSet
+from model import TaskSet, TaskType
 from scheduling import RateMonotonic
 
 class TestTaskGenerator:
@@ -50,6 +50,16 @@ class TestTaskGenerator:
         periods = [task.period for task in taskset]
         assert len(periods) == len(set(periods))
     
+    def test_generate_event_triggered(self, output_dir):
+        req = Requirement(name="Mixed", size=5, utilization=0.5, unique_periods=False, algorithm=RateMonotonic(), et_fraction=0.4)
+        generator = TaskGenerator(TaskRequirements([req]), output_dir)
+
+        taskset = generator.generate_taskset(req)
+
+        et_tasks = [task for task in taskset if task.task_type == TaskType.ET]
+        assert len(et_tasks) == 2
+        assert all(task.MIT == task.period for task in et_tasks)
+
     def test_verify_requirement_valid(self, basic_requirements, output_dir):
         generator = TaskGenerator(basic_requirements, output_dir)
         
@@ -1,2 +1,7 @@
 from .scheduling_algorithm import SchedulingAlgorithm
-from .rate_monotonic import RateMonotonic
\ No newline at end of file
+from .rate_monotonic import RateMonotonic
+from .response_time_analysis import ResponseTimeAnalysis
+from .breakdown import BreakdownAnalysis, analyze_folder
+from .regression import Solution, RegressionCase, RegressionResult, find_cases, run_regression
+from .polling_server import ServerDesign, PollingServerSearch
+from .amc import AMCAnalysis, AMCPriorityAssignment
@@ -0,0 +1,157 @@
+from math import ceil, inf
+from typing import Dict, Optional
+from model import Task, TaskSet, Criticality
+from .scheduling_algorithm import SchedulingAlgorithm
+
+class AMCAnalysis:
+    """
+    Adaptive Mixed Criticality response-time analysis (AMC-rtb, Baruah, Burns & Davis) for
+    dual-criticality tasksets under preemptive fixed-priority scheduling on a single core.
+
+    In LO mode every task runs with its WCET. When a HI task overruns its WCET the system
+    switches to HI mode, LO tasks are dropped and HI tasks may run up to their HI WCET. The
+    HI-mode bound of a HI task counts its higher-priority HI tasks at their HI WCET and its
+    higher-priority LO tasks only up to its LO-mode response time:
+
+        R_i* = C_i(HI) + sum_{j in hpH(i)} ceil(R_i* / T_j) C_j(HI) + sum_{k in hpL(i)} ceil(R_i(LO) / T_k) C_k(LO)
+
+    R_i(LO) is a lower bound on R_i*, so the HI-mode iteration starts from it.
+
+    Priorities follow ResponseTimeAnalysis: lower values mean higher priority and ties are
+    served in taskset order. Deadlines are assumed to be constrained (deadline <= period).
+    """
+
+    def __init__(self, taskset: TaskSet) -> None:
+        """
+        Args:
+            taskset: A TaskSet object with assigned priorities and criticality levels
+        """
+        self.taskset = taskset
+        indexed = sorted(enumerate(taskset), key=lambda item: (item[1].priority, item[0]))
+        self.ordered_tasks = [task for _, task in indexed]
+
+    def response_times(self, stop_at_deadline: bool = False) -> tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Compute the LO-mode response time of every task and the HI-mode response time of every HI task.
+
+        Args:
+            stop_at_deadline: Stop iterating a task as soon as its response time exceeds its
+                              deadline; the returned value is then only a lower bound
+
+        Returns:
+            tuple[Dict[str, float], Dict[str, float]]: The LO-mode and the HI-mode response
+            times per task name, math.inf if they diverge
+        """
+        limit = self.taskset.hyperperiod
+        lo, hi = {}, {}
+        for i, task in enumerate(self.ordered_tasks):
+            lo[task.name], hi_response = self.task_response_times(task, self.ordered_tasks[:i], limit, stop_at_deadline)
+            if hi_response is not None:
+                hi[task.name] = hi_response
+        return lo, hi
+
+    def is_schedulable(self) -> bool:
+        """
+        Check whether every task meets its deadline in LO mode and every HI task in HI mode.
+
+        Returns:
+            bool: True if the taskset is schedulable, False otherwise
+        """
+        limit = self.taskset.hyperperiod
+        return all(
+            self.task_schedulable(task, self.ordered_tasks[:i], limit)
+            for i, task in enumerate(self.ordered_tasks)
+        )
+
+    @staticmethod
+    def task_schedulable(task: Task, higher_priority: list[Task], limit: float) -> bool:
+        """
+        Check one task against a set of higher priority tasks. The result does not depend on
+        the relative priorities within that set, as Audsley's algorithm requires.
+
+        Args:
+            task: The task to check
+            higher_priority: The tasks with a higher priority
+            limit: Response times above max(limit, deadline) are treated as divergent
+
+        Returns:
+            bool: True if the task meets its deadline in both modes
+        """
+        lo, hi = AMCAnalysis.task_response_times(task, higher_priority, limit, stop_at_deadline=True)
+        return lo <= task.deadline and (hi is None or hi <= task.deadline)
+
+    @staticmethod
+    def task_response_times(task: Task,
+                            higher_priority: list[Task],
+                            limit: float,
+                            stop_at_deadline: bool = False) -> tuple[float, Optional[float]]:
+        """
+        Compute the LO-mode and (for a HI task) the HI-mode response time of one task.
+
+        Returns:
+            tuple[float, Optional[float]]: The LO-mode response time and the HI-mode response
+            time, None for a LO task
+        """
+        cap = max(limit, task.deadline)
+        lo = AMCAnalysis.__fixed_point(
+            task.wcet, [(hp.wcet, hp.period) for hp in higher_priority], 0, task.wcet, task.deadline, cap, stop_at_deadline
+        )
+        if task.criticality != Criticality.HI:
+            return lo, None
+        if lo == inf or (stop_at_deadline and lo > task.deadline):
+            return lo, lo
+
+        # LO tasks can only run before the mode switch, which happens by the LO-mode response time
+        dropped = sum(ceil(lo / hp.period) * hp.wcet for hp in higher_priority if hp.criticality != Criticality.HI)
+        hi_tasks = [(hp.wcet_hi, hp.period) for hp in higher_priority if hp.criticality == Criticality.HI]
+        hi = AMCAnalysis.__fixed_point(task.wcet_hi, hi_tasks, dropped, lo, task.deadline, cap, stop_at_deadline)
+        return lo, hi
+
+    @staticmethod
+    def __fixed_point(wcet: float, interfering: list, constant: float, start: float,
+                      deadline: float, cap: float, stop_at_deadline: bool) -> float:
+        response = start
+        while True:
+            demand = wcet + constant + sum(ceil(response / period) * c for c, period in interfering)
+            if demand <= response:
+                return response
+            if stop_at_deadline and demand > deadline:
+                return demand
+            if demand > cap:
+                return inf
+            response = demand
+
+class AMCPriorityAssignment(SchedulingAlgorithm):
+    """
+    Audsley's optimal priority assignment for AMC-rtb.
+
+    Priorities are assigned from the lowest up: each level goes to a task that passes the
+    AMC-rtb test with all still unassigned tasks above it, trying the longest deadlines
+    first. When no task fits a level the taskset is not AMC-rtb schedulable under any
+    priority order, and deadline monotonic priorities are assigned instead.
+    """
+
+    def assign_priorities(self, taskset: TaskSet) -> None:
+        """
+        Assign priorities to the tasks of a dual-criticality taskset.
+
+        Args:
+            taskset: A TaskSet object containing tasks to assign priorities to
+        """
+        deadline_monotonic = [task for _, task in sorted(enumerate(taskset), key=lambda item: (item[1].deadline, item[0]))]
+        limit = taskset.hyperperiod
+        unassigned = list(deadline_monotonic)
+        lowest_first = []
+        while unassigned:
+            for task in reversed(unassigned):
+                others = [other for other in unassigned if other is not task]
+                if AMCAnalysis.task_schedulable(task, others, limit):
+                    unassigned.remove(task)
+                    lowest_first.append(task)
+                    break
+            else:
+                lowest_first = deadline_monotonic[::-1]
+                break
+
+        for priority, task in enumerate(reversed(lowest_first)):
+            taskset.set_priority(task.name, priority)
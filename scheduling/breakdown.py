@@ -0,0 +1,149 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from math import ceil, inf
+from typing import Optional
+from model import TaskSet
+from .response_time_analysis import ResponseTimeAnalysis
+
+class BreakdownAnalysis:
+    """
+    Critical scaling factor and breakdown utilization of a taskset under its assigned priorities.
+
+    The critical scaling factor is the largest factor by which all WCETs can be multiplied while
+    the taskset stays schedulable. It is bracketed analytically and then refined by a binary
+    search, where each probe warm-starts the response-time analysis from the response times of
+    the largest schedulable factor found so far (response times only grow with the factor).
+    """
+
+    def __init__(self, taskset: TaskSet, tolerance: float = 1e-4) -> None:
+        """
+        Args:
+            taskset: A TaskSet object with assigned priorities
+            tolerance: Relative precision of the computed factor (default: 1e-4)
+        """
+        self.taskset = taskset
+        self.tolerance = tolerance
+        self.analysis = ResponseTimeAnalysis(taskset)
+
+    def critical_scaling_factor(self) -> float:
+        """
+        Compute the largest WCET scaling factor that keeps the taskset schedulable.
+
+        Returns:
+            float: The critical scaling factor, math.inf for an empty taskset
+        """
+        if len(self.taskset) == 0:
+            return inf
+
+        lower, upper = self.bounds()
+        if lower == upper or self.analysis.is_schedulable(scale=upper):
+            return upper
+
+        known = self.analysis.response_times(scale=lower)
+        while upper - lower > self.tolerance * lower:
+            probe = (lower + upper) / 2
+            response_times = self.analysis.response_times(scale=probe, initial=known, stop_at_deadline=True)
+            if all(response_times[task.name] <= task.deadline for task in self.taskset):
+                lower, known = probe, response_times
+            else:
+                upper = probe
+        return lower
+
+    def breakdown_utilization(self) -> float:
+        """
+        Compute the utilization of the taskset scaled by its critical scaling factor.
+
+        Returns:
+            float: The breakdown utilization
+        """
+        return self.critical_scaling_factor() * float(self.__utilization())
+
+    def bounds(self) -> tuple[float, float]:
+        """
+        Bracket the critical scaling factor analytically.
+
+        The lower bound requires every task's demand at its deadline to fit before the deadline
+        (a sufficient test that scales linearly), tightened by the hyperbolic bound when the
+        priorities are rate monotonic with implicit deadlines. The upper bound requires full
+        utilization at most and every task to fit its first job and one job of each higher
+        priority task before its deadline.
+
+        Returns:
+            tuple[float, float]: A schedulable and an upper bound on the critical scaling factor
+        """
+        ordered = self.analysis.ordered_tasks
+        lower = inf
+        upper = 1 / float(self.__utilization())
+        if self.analysis.harmonic:
+            # Harmonic rate monotonic tasksets break down exactly at full utilization
+            return upper, upper
+        for i, task in enumerate(ordered):
+            higher_priority = ordered[:i]
+            demand = task.wcet + sum(ceil(task.deadline / hp.period) * hp.wcet for hp in higher_priority)
+            first_jobs = task.wcet + sum(hp.wcet for hp in higher_priority)
+            if demand > 0:
+                lower = min(lower, task.deadline / demand)
+                upper = min(upper, task.deadline / first_jobs)
+
+        rate_monotonic = all(a.period <= b.period for a, b in zip(ordered, ordered[1:]))
+        implicit_deadlines = all(task.deadline == task.period for task in ordered)
+        if rate_monotonic and implicit_deadlines:
+            lower = max(lower, self.__hyperbolic_bound())
+        return min(lower, upper), upper
+
+    def __hyperbolic_bound(self) -> float:
+        # Largest factor with prod(factor * U_i + 1) <= 2, found by bisection
+        utilizations = [task.wcet / task.period for task in self.taskset]
+        lower, upper = 0.0, 1 / sum(utilizations)
+        for _ in range(50):
+            factor = (lower + upper) / 2
+            product = 1.0
+            for u in utilizations:
+                product *= factor * u + 1
+            if product <= 2:
+                lower = factor
+            else:
+                upper = factor
+        return lower
+
+    def __utilization(self) -> Fraction:
+        return sum((Fraction(task.wcet, task.period) for task in self.taskset), Fraction(0))
+
+def analyze_folder(path: str, tolerance: float = 1e-4, workers: Optional[int] = None) -> list[dict]:
+    """
+    Compute the critical scaling factor of every taskset CSV under a folder (or of a single CSV).
+    CSV files without a taskset header, such as earlier breakdown or experiment results, are skipped.
+
+    Args:
+        path: A folder searched recursively for taskset CSV files, or the path of one CSV file
+        tolerance: Relative precision of the computed factors (default: 1e-4)
+        workers: Number of worker processes (default: number of CPUs)
+
+    Returns:
+        list[dict]: One result per file with the file, utilization, factor and breakdown utilization
+    """
+    if os.path.isfile(path):
+        files = [path]
+    else:
+        files = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(path)
+            for name in names if name.endswith('.csv')
+            if TaskSet.is_csv(os.path.join(root, name))
+        )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_analyze_file, files, [tolerance] * len(files), chunksize=8))
+
+def _analyze_file(file_path: str, tolerance: float) -> dict:
+    taskset = TaskSet.from_csv(file_path)
+    analysis = BreakdownAnalysis(taskset, tolerance)
+    factor = analysis.critical_scaling_factor()
+    utilization = sum(task.wcet / task.period for task in taskset)
+    return {
+        'File': file_path,
+        'Utilization': utilization,
+        'ScalingFactor': factor,
+        'BreakdownUtilization': factor * utilization,
+    }
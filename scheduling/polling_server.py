@@ -0,0 +1,195 @@
+from math import ceil, inf, lcm
+from typing import Dict, Iterable, Optional
+from model import Task, TaskSet, TaskType
+from .scheduling_algorithm import SchedulingAlgorithm
+from .rate_monotonic import RateMonotonic
+from .response_time_analysis import ResponseTimeAnalysis
+
+class ServerDesign:
+    '''
+    A polling server configuration and the response times it leads to.
+
+    Attributes:
+        budget (int): The execution budget of the server per period.
+        period (int): The period (and deadline) of the server.
+        server_response_time (float): The worst-case response time of the server.
+        tt_response_times (Dict[str, float]): The worst-case response time of each TT task.
+        et_response_times (Dict[str, float]): The response time bound of each ET task.
+        et_misses (int): The number of ET tasks whose bound exceeds their deadline.
+    '''
+
+    def __init__(self, budget: int, period: int, server_response_time: float,
+                 tt_response_times: Dict[str, float], et_response_times: Dict[str, float], et_misses: int) -> None:
+        self.budget = budget
+        self.period = period
+        self.server_response_time = server_response_time
+        self.tt_response_times = tt_response_times
+        self.et_response_times = et_response_times
+        self.et_misses = et_misses
+
+    @property
+    def cost(self) -> tuple:
+        '''
+        The ranking key of the design: ET deadline misses first, then the sum of ET response times.
+        '''
+        return (self.et_misses, sum(self.et_response_times.values()))
+
+    def __repr__(self):
+        return (f"ServerDesign(budget={self.budget}, period={self.period}, "
+                f"server_response_time={self.server_response_time}, et_misses={self.et_misses})")
+
+class PollingServerSearch:
+    '''
+    Search for the polling server that serves the event-triggered (ET) tasks of a taskset.
+
+    The server is a periodic pseudo-task scheduled with the time-triggered (TT) tasks under the
+    given priority assignment. ET tasks are served in deadline-monotonic order, and the response
+    time of an ET task is bounded by R = ceil(W / Q) * T + R_s, where W is its busy window (its
+    WCET plus the interference of the ET tasks served before it, bounded through their MIT),
+    Q and T are the server budget and period and R_s is the worst-case response time of the server.
+
+    For every candidate period the search analyzes the budgets up to (1 - U_TT) * T, above which
+    the TT tasks and the server overload the core. A larger budget shortens the ET bounds through
+    ceil(W / Q) but can lengthen them through R_s, so every schedulable budget is a candidate,
+    including budgets below U_ET * T: when no configuration meets every ET deadline, such a budget
+    can still give the fewest misses. Periods and budgets whose ET bounds cannot beat the best
+    design so far, even with the smallest possible server response time, are skipped, and the
+    server response times are found with warm-started response time analyses.
+    '''
+
+    SERVER_NAME = "PollingServer"
+
+    def __init__(self, taskset: TaskSet, algorithm: Optional[SchedulingAlgorithm] = None) -> None:
+        '''
+        Args:
+            taskset (TaskSet): A taskset with TT and ET tasks. The MIT of an ET task is its minimum
+                               inter-arrival time, and its period when the MIT is not set.
+            algorithm (SchedulingAlgorithm): Assigns the priorities of the TT tasks and the server
+                                             (default: RateMonotonic).
+        '''
+
+        self.algorithm = algorithm if algorithm is not None else RateMonotonic()
+        self.tt_tasks = [task for task in taskset if task.task_type == TaskType.TT]
+        indexed = [(i, task) for i, task in enumerate(taskset) if task.task_type == TaskType.ET]
+        self.et_tasks = [task for _, task in sorted(indexed, key=lambda item: (item[1].deadline, item[0]))]
+        if not self.et_tasks:
+            raise ValueError("The taskset has no event-triggered tasks to serve.")
+        if any(task.name == self.SERVER_NAME for task in taskset):
+            raise ValueError(f"Task name {self.SERVER_NAME} is reserved for the server.")
+
+        self.tt_utilization = sum(task.wcet / task.period for task in self.tt_tasks)
+
+    def et_response_times(self, budget: int, period: int, server_response_time: float) -> Dict[str, float]:
+        '''
+        Bound the response time of every ET task for a server configuration.
+
+        Args:
+            budget (int): The server budget.
+            period (int): The server period.
+            server_response_time (float): The worst-case response time of the server.
+
+        Returns:
+            Dict[str, float]: The response time bound per ET task, math.inf if it diverges.
+        '''
+
+        limit = lcm(period, *(self.__mit(task) for task in self.et_tasks))
+        results = {}
+        served_before = []
+        for task in self.et_tasks:
+            workload = task.wcet + sum(c for c, _ in served_before)
+            while True:
+                response = ceil(workload / budget) * period + server_response_time
+                demand = task.wcet + sum(ceil(response / mit) * c for c, mit in served_before)
+                if demand <= workload:
+                    break
+                if response > max(limit, task.deadline):
+                    response = inf
+                    break
+                workload = demand
+            results[task.name] = response
+            served_before.append((task.wcet, self.__mit(task)))
+        return results
+
+    def evaluate(self, budget: int, period: int) -> Optional[ServerDesign]:
+        '''
+        Analyze one server configuration.
+
+        Returns:
+            ServerDesign: The design, None if the TT tasks or the server miss a deadline.
+        '''
+
+        taskset = self.__server_taskset(budget, period)
+        wcrt = ResponseTimeAnalysis(taskset).response_times()
+        if any(wcrt[task.name] > task.deadline for task in taskset):
+            return None
+        return self.__design(budget, period, wcrt)
+
+    def search(self, periods: Optional[Iterable[int]] = None) -> Optional[ServerDesign]:
+        '''
+        Find the server configuration that minimizes the ET response times.
+
+        Args:
+            periods (Iterable[int]): The candidate server periods (default: 1 up to the largest ET deadline).
+
+        Returns:
+            ServerDesign: The best design (fewest ET deadline misses, then smallest sum of ET
+                          response times), None if no configuration keeps the TT tasks and the
+                          server schedulable. The design may have ET misses when no configuration
+                          meets every ET deadline.
+        '''
+
+        if periods is None:
+            periods = range(1, max(task.deadline for task in self.et_tasks) + 1)
+
+        best = None
+        for period in sorted(set(int(p) for p in periods)):
+            high = int((1 - self.tt_utilization) * period + 1e-9)
+            if high < 1:
+                continue
+            # The ET bounds only shrink with the budget and grow with the server response time,
+            # which is at least 1, so the largest budget with R_s = 1 bounds the whole period
+            if best is not None and self.__cost(self.et_response_times(high, period, 1)) >= best.cost:
+                continue
+            best = self.__best_budget(period, high, best)
+        return best
+
+    def __best_budget(self, period: int, high: int, best: Optional[ServerDesign]) -> Optional[ServerDesign]:
+        # Interference only grows with the budget, so the schedulable budgets form a prefix
+        # of [1, high] and the response times of a budget are lower bounds for every larger one.
+        taskset = self.__server_taskset(1, period)
+        wcrt = None
+        for budget in range(1, high + 1):
+            if best is not None:
+                server_bound = max(budget, wcrt[self.SERVER_NAME]) if wcrt is not None else budget
+                if self.__cost(self.et_response_times(budget, period, server_bound)) >= best.cost:
+                    continue
+            taskset.set_wcet(self.SERVER_NAME, budget)
+            probe = ResponseTimeAnalysis(taskset).response_times(initial=wcrt, stop_at_deadline=True)
+            if any(probe[task.name] > task.deadline for task in taskset):
+                break
+            wcrt = probe
+            design = self.__design(budget, period, wcrt)
+            if best is None or design.cost < best.cost:
+                best = design
+        return best
+
+    def __cost(self, et_wcrt: Dict[str, float]) -> tuple:
+        misses = sum(et_wcrt[task.name] > task.deadline for task in self.et_tasks)
+        return (misses, sum(et_wcrt.values()))
+
+    def __design(self, budget: int, period: int, wcrt: Dict[str, float]) -> ServerDesign:
+        server_response_time = wcrt[self.SERVER_NAME]
+        et_wcrt = self.et_response_times(budget, period, server_response_time)
+        misses, _ = self.__cost(et_wcrt)
+        tt_wcrt = {task.name: wcrt[task.name] for task in self.tt_tasks}
+        return ServerDesign(budget, period, server_response_time, tt_wcrt, et_wcrt, misses)
+
+    def __server_taskset(self, budget: int, period: int) -> TaskSet:
+        # The server comes first so it wins priority ties against TT tasks of the same period
+        server = Task(name=self.SERVER_NAME, bcet=0, wcet=budget, period=period, deadline=period)
+        taskset = TaskSet([server] + self.tt_tasks)
+        self.algorithm.assign_priorities(taskset)
+        return taskset
+
+    def __mit(self, task: Task) -> int:
+        return task.MIT if task.MIT > 0 else task.period
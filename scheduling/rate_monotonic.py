@@ -15,9 +15,39 @@ class RateMonotonic(SchedulingAlgorithm):
             taskset: A TaskSet object containing tasks to assign priorities to
         """
         sorted_tasks = sorted(taskset, key=lambda task: task.period)
+        priority = 0
         for i, task in enumerate(sorted_tasks):
             # Maintain equal priority for equal periods
-            if i > 0 and task.period == sorted_tasks[i - 1].period:
-                task.priority = sorted_tasks[i - 1].priority
-            else:
-                task.priority = i
+            if i == 0 or task.period != sorted_tasks[i - 1].period:
+                priority = i
+            taskset.set_priority(task.name, priority)
+
+    def update_priorities(self, taskset: TaskSet, name: str, old_period, new_period) -> None:
+        """
+        Incrementally update priorities after a single period change, addition or removal.
+
+        A task's priority is the number of tasks with a strictly shorter period, so only the
+        tasks whose period lies between the old and the new period shift by one.
+
+        Args:
+            taskset: The TaskSet object after the change
+            name: The name of the changed task
+            old_period: The period before the change, None if the task was added
+            new_period: The period after the change, None if the task was removed
+        """
+        shorter = 0
+        for task in taskset:
+            if task.name == name:
+                continue
+            shift = 0
+            if old_period is not None and task.period > old_period:
+                shift -= 1
+            if new_period is not None:
+                if task.period > new_period:
+                    shift += 1
+                elif task.period < new_period:
+                    shorter += 1
+            if shift:
+                taskset.set_priority(task.name, task.priority + shift)
+        if new_period is not None:
+            taskset.set_priority(name, shorter)
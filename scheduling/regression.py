@@ -0,0 +1,196 @@
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+from model import Task, TaskSet
+from .response_time_analysis import ResponseTimeAnalysis
+
+TASK_PATTERN = re.compile(
+    r'Task\((?P<name>[^,]+), BCET=(?P<bcet>\d+), WCET=(?P<wcet>\d+), Period=(?P<period>\d+), '
+    r'Deadline=(?P<deadline>\d+),.*Priority=(?P<priority>\d+)'
+)
+
+class Solution:
+    '''
+    A reference analysis result, as stored in the solution_<case>.txt files.
+
+    Attributes:
+        taskset (TaskSet): The taskset listed in the file header.
+        schedulable (bool): The expected verdict.
+        wcrt (Dict[str, float]): The expected worst-case response time per task.
+    '''
+
+    def __init__(self, taskset: TaskSet, schedulable: bool, wcrt: Dict[str, float]) -> None:
+        self.taskset = taskset
+        self.schedulable = schedulable
+        self.wcrt = wcrt
+
+    @classmethod
+    def from_file(cls, file_path: str) -> 'Solution':
+        '''
+        Parse a solution file: the TaskSet header followed by the response time analysis table.
+
+        Args:
+            file_path (str): The path of the solution file.
+
+        Returns:
+            Solution: The parsed solution.
+        '''
+        taskset = TaskSet()
+        schedulable = None
+        wcrt = {}
+        separators = 0
+        with open(file_path, mode='r', encoding='utf-8') as file:
+            for line in file:
+                stripped = line.strip()
+                match = TASK_PATTERN.match(stripped)
+                if match:
+                    taskset.add_task(Task(
+                        name=match.group('name'),
+                        bcet=int(match.group('bcet')),
+                        wcet=int(match.group('wcet')),
+                        period=int(match.group('period')),
+                        deadline=int(match.group('deadline')),
+                        priority=int(match.group('priority')),
+                    ))
+                elif stripped.startswith('Schedulable:'):
+                    schedulable = stripped.split(':', 1)[1].strip() == 'True'
+                elif stripped and set(stripped) <= set('- '):
+                    separators += 1
+                elif separators == 1 and stripped:
+                    # Rows of the WCRT table: Task, WCRT, Deadline, Status
+                    name, response_time = stripped.split()[:2]
+                    wcrt[name] = float(response_time)
+
+        if schedulable is None or not wcrt:
+            raise ValueError(f"{file_path} is not a valid solution file.")
+        return cls(taskset, schedulable, wcrt)
+
+class RegressionCase:
+    '''
+    A taskset with its expected analysis results.
+
+    Attributes:
+        name (str): The case name.
+        taskset_file (str): The taskset CSV, None when the taskset comes from the solution header.
+        solution_file (str): The solution file, None when only the verdict is known.
+        schedulable (bool): The expected verdict.
+    '''
+
+    def __init__(self, name: str, taskset_file: Optional[str], solution_file: Optional[str], schedulable: Optional[bool] = None) -> None:
+        self.name = name
+        self.taskset_file = taskset_file
+        self.solution_file = solution_file
+        self.schedulable = schedulable
+
+    def __repr__(self):
+        return f"RegressionCase(name={self.name}, taskset_file={self.taskset_file}, solution_file={self.solution_file})"
+
+class RegressionResult:
+    '''
+    The outcome of re-running the analysis of one case.
+
+    Attributes:
+        case (RegressionCase): The case.
+        differences (list[str]): Every mismatch with the expected results.
+        elapsed (float): The time spent parsing and analyzing the case, in seconds.
+    '''
+
+    def __init__(self, case: RegressionCase, differences: list[str], elapsed: float) -> None:
+        self.case = case
+        self.differences = differences
+        self.elapsed = elapsed
+
+    @property
+    def passed(self) -> bool:
+        return not self.differences
+
+def find_cases(solutions_dir: str, examples_dir: str) -> list[RegressionCase]:
+    '''
+    Collect the regression cases of the reference corpus.
+
+    Every solution_<case>.txt file is a case, analyzed on <case>.csv from the examples folder when
+    it exists and on the taskset of the solution header otherwise. Every other example CSV is a
+    case whose expected verdict is given by its folder (schedulable or not_schedulable).
+
+    Args:
+        solutions_dir (str): The folder with the solution files.
+        examples_dir (str): The folder with the example tasksets.
+
+    Returns:
+        list[RegressionCase]: The cases, sorted by name.
+    '''
+    examples = {}
+    for root, _, names in os.walk(examples_dir):
+        for name in names:
+            if name.endswith('.csv'):
+                examples[name[:-len('.csv')]] = os.path.join(root, name)
+
+    cases = {}
+    for name in sorted(os.listdir(solutions_dir)):
+        match = re.fullmatch(r'solution_(.+)\.txt', name)
+        if match:
+            case = match.group(1)
+            cases[case] = RegressionCase(case, examples.get(case), os.path.join(solutions_dir, name))
+
+    for case, file_path in examples.items():
+        if case not in cases:
+            folder = os.path.basename(os.path.dirname(file_path))
+            if folder in ('schedulable', 'not_schedulable'):
+                cases[case] = RegressionCase(case, file_path, None, folder == 'schedulable')
+
+    return [cases[name] for name in sorted(cases)]
+
+def run_case(case: RegressionCase) -> RegressionResult:
+    '''
+    Re-run the response time analysis of a case and compare it with the expected results.
+
+    Args:
+        case (RegressionCase): The case.
+
+    Returns:
+        RegressionResult: The differences and the elapsed time.
+    '''
+    start = time.perf_counter()
+    differences = []
+    solution = Solution.from_file(case.solution_file) if case.solution_file else None
+
+    if case.taskset_file:
+        taskset = TaskSet.from_csv(case.taskset_file)
+        if solution is not None and taskset.fingerprint() != solution.taskset.fingerprint():
+            differences.append("taskset differs from the solution header")
+    else:
+        taskset = solution.taskset
+
+    wcrt = ResponseTimeAnalysis(taskset).response_times()
+    schedulable = all(wcrt[task.name] <= task.deadline for task in taskset)
+
+    expected = solution.schedulable if solution is not None else case.schedulable
+    if schedulable != expected:
+        differences.append(f"verdict: expected {expected}, got {schedulable}")
+    if solution is not None:
+        for name, expected_wcrt in solution.wcrt.items():
+            actual = wcrt.get(name)
+            if actual is None:
+                differences.append(f"{name}: missing from the taskset")
+            elif abs(actual - expected_wcrt) > 1e-6:
+                differences.append(f"{name}: WCRT expected {expected_wcrt}, got {actual}")
+
+    return RegressionResult(case, differences, time.perf_counter() - start)
+
+def run_regression(solutions_dir: str, examples_dir: str, workers: Optional[int] = None) -> list[RegressionResult]:
+    '''
+    Run every regression case of the reference corpus over a process pool.
+
+    Args:
+        solutions_dir (str): The folder with the solution files.
+        examples_dir (str): The folder with the example tasksets.
+        workers (int): Number of worker processes (default: number of CPUs).
+
+    Returns:
+        list[RegressionResult]: One result per case, sorted by case name.
+    '''
+    cases = find_cases(solutions_dir, examples_dir)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_case, cases))
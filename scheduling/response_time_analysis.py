@@ -0,0 +1,102 @@
+from fractions import Fraction
+from math import ceil, inf
+from typing import Dict, Optional
+from model import TaskSet
+
+class ResponseTimeAnalysis:
+    """
+    Exact response-time analysis for preemptive fixed-priority scheduling on a single core.
+
+    Lower priority values mean higher priority. Tasks that share a priority are served in
+    the order they appear in the taskset, so an earlier task interferes with a later one.
+    Deadlines are assumed to be constrained (deadline <= period).
+
+    Harmonic tasksets (every period divides the next longer one) with implicit deadlines and
+    rate monotonic priorities are schedulable exactly when their utilization is at most 1
+    (Kuo & Mok), so is_schedulable decides them in linear time without the fixed-point iteration.
+    """
+
+    def __init__(self, taskset: TaskSet) -> None:
+        """
+        Prepare the analysis for a taskset whose priorities are already assigned.
+
+        Args:
+            taskset: A TaskSet object with assigned priorities
+        """
+        self.taskset = taskset
+        indexed = sorted(enumerate(taskset), key=lambda item: (item[1].priority, item[0]))
+        self.ordered_tasks = [task for _, task in indexed]
+        self.harmonic = self.__is_harmonic_rate_monotonic()
+
+    def response_times(self,
+                       scale: float = 1.0,
+                       initial: Optional[Dict[str, float]] = None,
+                       stop_at_deadline: bool = False) -> Dict[str, float]:
+        """
+        Compute the worst-case response time of every task.
+
+        Args:
+            scale: Factor applied to every WCET before the analysis (default: 1.0)
+            initial: Known lower bounds on the response times, used as starting points
+                     for the fixed-point iteration (e.g. results for a smaller scale)
+            stop_at_deadline: Stop iterating a task as soon as its response time exceeds
+                              its deadline; the returned value is then only a lower bound
+
+        Returns:
+            Dict[str, float]: The response time per task name, math.inf if it diverges
+        """
+        results = {}
+        higher_priority = []
+        for task in self.ordered_tasks:
+            wcet = task.wcet * scale
+            start = wcet + sum(c for c, _ in higher_priority)
+            if initial is not None and initial.get(task.name, 0) > start:
+                start = initial[task.name]
+
+            results[task.name] = self.__fixed_point(
+                wcet, task.deadline, higher_priority, start, stop_at_deadline
+            )
+            higher_priority.append((wcet, task.period))
+        return results
+
+    def is_schedulable(self, scale: float = 1.0, initial: Optional[Dict[str, float]] = None) -> bool:
+        """
+        Check whether every task meets its deadline.
+
+        Args:
+            scale: Factor applied to every WCET before the analysis (default: 1.0)
+            initial: Known lower bounds on the response times (see response_times)
+
+        Returns:
+            bool: True if the taskset is schedulable, False otherwise
+        """
+        if self.harmonic:
+            utilization = sum((Fraction(task.wcet) / Fraction(task.period) for task in self.ordered_tasks), Fraction(0))
+            return utilization * Fraction(scale) <= 1
+        wcrt = self.response_times(scale, initial, stop_at_deadline=True)
+        return all(wcrt[task.name] <= task.deadline for task in self.taskset)
+
+    def __is_harmonic_rate_monotonic(self) -> bool:
+        # In priority order the periods must not decrease, each must divide the next one,
+        # and every deadline must equal its period
+        previous = None
+        for task in self.ordered_tasks:
+            if task.deadline != task.period:
+                return False
+            if previous is not None and (task.period < previous.period or task.period % previous.period != 0):
+                return False
+            previous = task
+        return True
+
+    def __fixed_point(self, wcet: float, deadline: float, higher_priority: list, start: float, stop_at_deadline: bool) -> float:
+        response = start
+        while True:
+            demand = wcet + sum(ceil(response / period) * c for c, period in higher_priority)
+            if demand <= response:
+                return response
+            if stop_at_deadline and demand > deadline:
+                return demand
+            # Without a fixed point inside the hyperperiod the iteration diverges
+            if demand > max(self.taskset.hyperperiod, deadline):
+                return inf
+            response = demand
@@ -16,3 +16,28 @@ class SchedulingAlgorithm(ABC):
             taskset: A TaskSet object containing tasks to assign priorities to
         """
         pass
+
+    def assign_priorities_batch(self, tasksets: list[TaskSet]) -> None:
+        """
+        Assign priorities to many tasksets at once.
+
+        Args:
+            tasksets: The TaskSet objects to assign priorities to
+        """
+        for taskset in tasksets:
+            self.assign_priorities(taskset)
+
+    def update_priorities(self, taskset: TaskSet, name: str, old_period, new_period) -> None:
+        """
+        Update priorities after the period of one task changed, or a task was added or removed.
+
+        The default implementation reassigns all priorities; algorithms can override it
+        with an incremental update.
+
+        Args:
+            taskset: The TaskSet object after the change
+            name: The name of the changed task
+            old_period: The period before the change, None if the task was added
+            new_period: The period after the change, None if the task was removed
+        """
+        self.assign_priorities(taskset)